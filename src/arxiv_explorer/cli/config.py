@@ -147,25 +147,20 @@ def set_custom(
 @app.command("test")
 def test():
     """Test current provider connection."""
-    settings = SettingsService()
-    provider_type = settings.get_provider()
-    provider = get_provider(provider_type)
+    ai = SettingsService().snapshot()
+    provider = get_provider(ai.provider)
 
-    if provider_type == AIProviderType.CUSTOM and not provider.cli_command:
+    if ai.provider == AIProviderType.CUSTOM and not provider.cli_command:
         print_error("No custom command configured. Use 'axp config set-custom' first")
         raise typer.Exit(1)
 
-    console.print(f"Testing [cyan]{provider_type.value}[/cyan] ({provider.cli_command})...")
+    console.print(f"Testing [cyan]{ai.provider}[/cyan] ({provider.cli_command})...")
 
     if not provider.is_available():
         print_error(f"'{provider.cli_command}' not found on PATH")
         raise typer.Exit(1)
 
-    output = provider.invoke(
-        "Say 'hello' in one word.",
-        model=settings.get_model(),
-        timeout=settings.get_timeout(),
-    )
+    output = provider.with_config(ai.model, ai.timeout).invoke("Say 'hello' in one word.")
     if output:
         print_success(f"Response: {output[:200]}")
     else:
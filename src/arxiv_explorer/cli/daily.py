@@ -1,10 +1,14 @@
 """Daily paper commands."""
 
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
 import typer
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from ..core.models import RecommendedPaper
 from ..services.paper_service import PaperService
 from ..services.preference_service import PreferenceService
 from ..services.summarization import SummarizationService
@@ -17,6 +21,44 @@ from ..utils.display import (
     print_paper_list,
     print_success,
 )
+from .notes import _add_note
+
+# Summaries are independent provider calls (one CLI subprocess each)
+MAX_PARALLEL_SUMMARIES = 4
+
+
+def _summarize_papers(papers: list[RecommendedPaper], detailed: bool) -> None:
+    """Attach summaries to papers, generating several at once."""
+    summarizer = SummarizationService()
+    summary_type = "detailed summary" if detailed else "summary"
+    success_count = 0
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        console=console,
+    ) as progress:
+        task = progress.add_task(f"Generating {summary_type}...", total=len(papers))
+        with ThreadPoolExecutor(max_workers=MAX_PARALLEL_SUMMARIES) as executor:
+            futures = {
+                executor.submit(
+                    summarizer.summarize,
+                    rec.paper.arxiv_id,
+                    rec.paper.title,
+                    rec.paper.abstract,
+                    detailed=detailed,
+                ): rec
+                for rec in papers
+            }
+            for future in as_completed(futures):
+                rec = futures[future]
+                rec.summary = future.result()
+                if rec.summary:
+                    success_count += 1
+                progress.advance(task)
+
+    if success_count < len(papers):
+        failed_count = len(papers) - success_count
+        print_info(f"Summaries: {success_count} succeeded, {failed_count} failed")
 
 
 def daily(
@@ -29,8 +71,6 @@ def daily(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ):
     """Fetch today's/recent papers (personalized ranking)."""
-    import json
-
     service = PaperService()
     pref_service = PreferenceService()
 
@@ -44,7 +84,9 @@ def daily(
         raise typer.Exit(1)
 
     if json_output:
-        author_papers, scored_papers = service.get_daily_papers(days=days, limit=limit)
+        author_papers, scored_papers = service.get_daily_papers(
+            days=days, limit=limit, categories=categories
+        )
 
         def paper_to_dict(rec):
             p = rec.paper
@@ -73,8 +115,10 @@ def daily(
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task("Fetching papers...", total=None)
-        author_papers, scored_papers = service.get_daily_papers(days=days, limit=limit)
+        progress.add_task("Fetching papers...", total=None)
+        author_papers, scored_papers = service.get_daily_papers(
+            days=days, limit=limit, categories=categories
+        )
         papers = author_papers + scored_papers
 
     if not papers:
@@ -85,30 +129,7 @@ def daily(
 
     # Generate summaries
     if summarize or detailed:
-        summarizer = SummarizationService()
-        summary_type = "detailed summary" if detailed else "summary"
-        success_count = 0
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Generating {summary_type}...", total=len(papers))
-            for rec in papers:
-                summary = summarizer.summarize(
-                    rec.paper.arxiv_id,
-                    rec.paper.title,
-                    rec.paper.abstract,
-                    detailed=detailed,
-                )
-                rec.summary = summary
-                if summary:
-                    success_count += 1
-                progress.advance(task)
-
-        if success_count < len(papers):
-            failed_count = len(papers) - success_count
-            print_info(f"Summaries: {success_count} succeeded, {failed_count} failed")
+        _summarize_papers(papers, detailed)
 
     print_paper_list(papers)
 
@@ -126,7 +147,7 @@ def top(
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        task = progress.add_task("Fetching top papers...", total=None)
+        progress.add_task("Fetching top papers...", total=None)
         author_papers, scored_papers = service.get_daily_papers(days=7, limit=limit)
         papers = author_papers + scored_papers
 
@@ -138,30 +159,7 @@ def top(
 
     # Generate summaries
     if summarize or detailed:
-        summarizer = SummarizationService()
-        summary_type = "detailed summary" if detailed else "summary"
-        success_count = 0
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
-            task = progress.add_task(f"Generating {summary_type}...", total=len(papers))
-            for rec in papers:
-                summary = summarizer.summarize(
-                    rec.paper.arxiv_id,
-                    rec.paper.title,
-                    rec.paper.abstract,
-                    detailed=detailed,
-                )
-                rec.summary = summary
-                if summary:
-                    success_count += 1
-                progress.advance(task)
-
-        if success_count < len(papers):
-            failed_count = len(papers) - success_count
-            print_info(f"Summaries: {success_count} succeeded, {failed_count} failed")
+        _summarize_papers(papers, detailed)
 
     print_paper_list(papers)
 
@@ -176,8 +174,6 @@ def like(
     print_success(f"{arxiv_id} marked as interesting")
 
     if note:
-        from .notes import _add_note
-
         _add_note(arxiv_id, note, "general")
 
 
@@ -232,18 +228,17 @@ def show(
         print_error(f"Paper not found: {arxiv_id}")
         raise typer.Exit(1)
 
+    # Translate only after the summary succeeds: a provider call in flight cannot
+    # be cancelled, so a failed command would wait on it and still cache it
     paper_summary = None
     if summary or detailed:
         summarizer = SummarizationService()
         paper_summary = summarizer.summarize(
             arxiv_id, paper.title, paper.abstract, detailed=detailed, force=force
         )
-
-    if (summary or detailed) and paper_summary is None:
-        import sys
-
-        print("Failed to generate summary (check provider settings)", file=sys.stderr)
-        raise typer.Exit(1)
+        if paper_summary is None:
+            print("Failed to generate summary (check provider settings)", file=sys.stderr)
+            raise typer.Exit(1)
 
     paper_translation = None
     if translate:
@@ -259,8 +254,6 @@ def show(
             )
 
     if translate and paper_translation is None:
-        import sys
-
         print("Failed to generate translation (check provider settings)", file=sys.stderr)
         raise typer.Exit(1)
 
@@ -8,6 +8,12 @@ from ..core.models import ReadingStatus
 from ..services.reading_list_service import ReadingListService
 from ..utils.display import console, print_error, print_success
 
+_STATUS_ICONS: dict[ReadingStatus, str] = {
+    ReadingStatus.UNREAD: "○",
+    ReadingStatus.READING: "◐",
+    ReadingStatus.COMPLETED: "●",
+}
+
 app = typer.Typer(
     help="Reading list management",
     no_args_is_help=False,
@@ -118,12 +124,7 @@ def show(
         return
 
     for p in papers:
-        status_icon = {
-            ReadingStatus.UNREAD: "○",
-            ReadingStatus.READING: "◐",
-            ReadingStatus.COMPLETED: "●",
-        }[p.status]
-
+        status_icon = _STATUS_ICONS[p.status]
         console.print(f"  {status_icon} {p.arxiv_id} [{p.status.value}]")
 
 
@@ -137,6 +138,6 @@ def ls():
         console.print("[dim]No reading lists[/dim]")
         return
 
+    counts = service.get_paper_counts()
     for lst in lists:
-        papers = service.get_papers(lst.name)
-        console.print(f"  • {lst.name} ({len(papers)} papers)")
+        console.print(f"  • {lst.name} ({counts.get(lst.id, 0)} papers)")
@@ -8,6 +8,13 @@ from ..core.models import NoteType
 from ..services.notes_service import NotesService
 from ..utils.display import console, print_error, print_success
 
+_NOTE_TYPE_COLORS: dict[NoteType, str] = {
+    NoteType.GENERAL: "white",
+    NoteType.QUESTION: "yellow",
+    NoteType.INSIGHT: "green",
+    NoteType.TODO: "red",
+}
+
 app = typer.Typer(
     help="Paper note management",
     no_args_is_help=False,
@@ -62,13 +69,7 @@ def show(
     console.print(f"\n[bold]{arxiv_id} notes[/bold]\n")
 
     for note in notes:
-        type_color = {
-            NoteType.GENERAL: "white",
-            NoteType.QUESTION: "yellow",
-            NoteType.INSIGHT: "green",
-            NoteType.TODO: "red",
-        }[note.note_type]
-
+        type_color = _NOTE_TYPE_COLORS[note.note_type]
         console.print(f"[{type_color}][{note.note_type.value}][/{type_color}] {note.content}")
         console.print(f"  [dim]{note.created_at.strftime('%Y-%m-%d %H:%M')}[/dim]\n")
 
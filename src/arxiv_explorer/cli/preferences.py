@@ -71,7 +71,7 @@ def show():
     """View current preferences."""
     service = PreferenceService()
 
-    categories = service.get_categories()
+    categories, keywords = service.get_categories_and_keywords()
     if categories:
         print_categories(categories)
     else:
@@ -79,7 +79,6 @@ def show():
 
     console.print()
 
-    keywords = service.get_keywords()
     if keywords:
         console.print("[bold]Keyword interests:[/bold]")
         for kw in keywords:
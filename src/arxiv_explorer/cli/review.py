@@ -4,6 +4,7 @@ from pathlib import Path
 from typing import Optional
 
 import typer
+from rich.markdown import Markdown
 from rich.progress import (
     BarColumn,
     Progress,
@@ -19,7 +20,7 @@ from ..services.review_service import PaperReviewService
 from ..services.settings_service import SettingsService
 from ..utils.display import console, print_error, print_info, print_success
 
-# Human-readable names for review sections
+# Human-readable names for review sections (covers every ReviewSectionType)
 _SECTION_NAMES: dict[ReviewSectionType, str] = {
     ReviewSectionType.EXECUTIVE_SUMMARY: "Executive Summary",
     ReviewSectionType.KEY_CONTRIBUTIONS: "Key Contributions",
@@ -60,6 +61,9 @@ def review(
         False, "--status", "-s", help="Show cached review status without generating"
     ),
     delete: bool = typer.Option(False, "--delete", help="Delete cached review for this paper"),
+    bundle: bool = typer.Option(
+        False, "--bundle", help="Request all sections in a single AI call (fewer API calls)"
+    ),
 ):
     """Generate a comprehensive AI review of an arXiv paper.
 
@@ -73,6 +77,7 @@ def review(
         axp review 2401.00001 -o review.md
         axp review 2401.00001 --force --translate
         axp review 2401.00001 --status
+        axp review 2401.00001 --no-full-text --bundle
     """
     review_service = PaperReviewService()
 
@@ -99,7 +104,7 @@ def review(
                     icon = "[green]\u2714[/green]"
                 else:
                     icon = "[dim]\u2022[/dim]"
-                console.print(f"  {icon} {_SECTION_NAMES.get(st, st.value)}")
+                console.print(f"  {icon} {_SECTION_NAMES[st]}")
         return
 
     # Fetch paper metadata
@@ -118,7 +123,7 @@ def review(
         raise typer.Exit(1)
 
     console.print(f"\n[bold]{paper.title}[/bold]")
-    console.print(f"[dim]{', '.join(paper.authors[:5])}[/dim]\n")
+    console.print(f"[dim]{paper.authors_display}[/dim]\n")
 
     # If --no-full-text, skip extraction
     if no_full_text:
@@ -139,7 +144,7 @@ def review(
         task = progress.add_task("Generating review...", total=len(ReviewSectionType))
 
         def on_start(section_type: ReviewSectionType, idx: int, total: int) -> None:
-            name = _SECTION_NAMES.get(section_type, section_type.value)
+            name = _SECTION_NAMES[section_type]
             progress.update(task, description=f"[cyan]{name}[/cyan]...")
 
         def on_complete(section_type: ReviewSectionType, success: bool) -> None:
@@ -155,6 +160,7 @@ def review(
             force=force,
             on_section_start=on_start,
             on_section_complete=on_complete,
+            bundle=bundle,
         )
 
     if not paper_review:
@@ -189,6 +195,4 @@ def review(
         print_success(f"Review saved: {output}")
     else:
         console.print()
-        from rich.markdown import Markdown
-
         console.print(Markdown(markdown))
@@ -1,5 +1,7 @@
 """Search commands."""
 
+import json
+
 import typer
 
 from ..services.paper_service import PaperService
@@ -13,8 +15,6 @@ def search(
     json_output: bool = typer.Option(False, "--json", help="Output as JSON"),
 ):
     """Search papers."""
-    import json
-
     service = PaperService()
 
     papers = service.search_papers(query, limit=limit, from_arxiv=arxiv)
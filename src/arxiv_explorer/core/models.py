@@ -3,6 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Optional
 
 
@@ -77,6 +78,11 @@ class ReviewSectionType(str, Enum):
     READING_GUIDE = "reading_guide"
 
 
+# Materialized once for PaperReview completeness checks
+_ALL_SECTION_TYPES = tuple(ReviewSectionType)
+_ALL_SECTION_SET = frozenset(_ALL_SECTION_TYPES)
+
+
 @dataclass
 class Paper:
     """Paper data model."""
@@ -94,6 +100,30 @@ class Paper:
     def primary_category(self) -> str:
         return self.categories[0] if self.categories else ""
 
+    # Display strings, computed once per paper
+    @cached_property
+    def display_title(self) -> str:
+        """Title shortened to fit the 50-column paper list."""
+        return self.title[:47] + "..." if len(self.title) > 50 else self.title
+
+    @cached_property
+    def authors_display(self) -> str:
+        """First five authors, comma-separated."""
+        return ", ".join(self.authors[:5])
+
+    @cached_property
+    def categories_display(self) -> str:
+        return ", ".join(self.categories)
+
+    @cached_property
+    def published_display(self) -> str:
+        return self.published.strftime("%Y-%m-%d")
+
+    @cached_property
+    def search_text(self) -> str:
+        """Lowercased title and abstract, as matched by the recommendation engine."""
+        return f"{self.title} {self.abstract}".lower()
+
 
 @dataclass
 class PreferredCategory:
@@ -104,6 +134,10 @@ class PreferredCategory:
     priority: int = 1
     added_at: datetime = field(default_factory=datetime.now)
 
+    @cached_property
+    def added_display(self) -> str:
+        return self.added_at.strftime("%Y-%m-%d")
+
 
 @dataclass
 class PaperInteraction:
@@ -202,6 +236,7 @@ class ReviewSection:
     arxiv_id: str
     section_type: ReviewSectionType
     content_json: str
+    source_type: str = "abstract"
     generated_at: datetime = field(default_factory=datetime.now)
 
 
@@ -222,11 +257,11 @@ class PaperReview:
 
     @property
     def is_complete(self) -> bool:
-        return set(self.sections.keys()) == set(ReviewSectionType)
+        return self.sections.keys() >= _ALL_SECTION_SET
 
     @property
     def missing_sections(self) -> list[ReviewSectionType]:
-        return [s for s in ReviewSectionType if s not in self.sections]
+        return [s for s in _ALL_SECTION_TYPES if s not in self.sections]
 
 
 @dataclass
@@ -0,0 +1,38 @@
+"""Coalescing of identical in-flight AI requests."""
+
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_inflight: dict[Hashable, Future] = {}
+_lock = threading.Lock()
+
+
+def run_once(key: Hashable, fn: Callable[[], T]) -> T:
+    """Run ``fn``, or wait for the result of an identical call already running.
+
+    Concurrent callers with the same key share one invocation; the key is
+    released as soon as that invocation finishes, so later calls run again.
+    """
+    with _lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if owner:
+            future = _inflight[key] = Future()
+    if not owner:
+        return future.result()
+
+    try:
+        result = fn()
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _lock:
+            del _inflight[key]
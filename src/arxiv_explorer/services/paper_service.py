@@ -1,6 +1,8 @@
 """Paper service."""
 
-from ..core.models import Paper, RecommendedPaper
+from typing import Optional
+
+from ..core.models import Paper, PreferredCategory, RecommendedPaper
 from .arxiv_client import ArxivClient
 from .author_service import AuthorService
 from .preference_service import PreferenceService
@@ -19,10 +21,16 @@ class PaperService:
         self,
         days: int = 1,
         limit: int = 50,
+        categories: Optional[list[PreferredCategory]] = None,
     ) -> tuple[list[RecommendedPaper], list[RecommendedPaper]]:
-        """Get daily papers. Returns (author_matched, scored)."""
-        # Get preferred categories
-        categories = self.preference_service.get_categories()
+        """Get daily papers. Returns (author_matched, scored).
+
+        Pass ``categories`` when the caller has already loaded them.
+        """
+        # Get preferred categories (and keywords, from the same connection)
+        keywords = None
+        if categories is None:
+            categories, keywords = self.preference_service.get_categories_and_keywords()
         if not categories:
             return [], []
 
@@ -54,7 +62,8 @@ class PaperService:
                 liked_papers.append(paper)
 
         user_profile = engine.build_user_profile(liked_papers)
-        keywords = self.preference_service.get_keywords()
+        if keywords is None:
+            keywords = self.preference_service.get_keywords()
 
         # Score and sort
         recommended = engine.score_papers(
@@ -83,8 +92,7 @@ class PaperService:
 
         # Calculate recommendation scores (no recency bias for search)
         engine = get_recommendation_engine()
-        categories = self.preference_service.get_categories()
-        keywords = self.preference_service.get_keywords()
+        categories, keywords = self.preference_service.get_categories_and_keywords()
 
         recommended = engine.score_papers(
             papers=papers,
@@ -1,5 +1,7 @@
 """User preference service."""
 
+import sqlite3
+from contextlib import nullcontext
 from datetime import datetime
 
 from ..core.database import get_connection
@@ -46,10 +48,10 @@ class PreferenceService:
             conn.commit()
             return cursor.rowcount > 0
 
-    def get_categories(self) -> list[PreferredCategory]:
+    def get_categories(self, conn: sqlite3.Connection | None = None) -> list[PreferredCategory]:
         """Get the list of preferred categories."""
-        with get_connection() as conn:
-            rows = conn.execute(
+        with nullcontext(conn) if conn is not None else get_connection() as db:
+            rows = db.execute(
                 "SELECT * FROM preferred_categories ORDER BY priority DESC"
             ).fetchall()
 
@@ -159,10 +161,10 @@ class PreferenceService:
             conn.commit()
             return cursor.rowcount > 0
 
-    def get_keywords(self) -> list[KeywordInterest]:
+    def get_keywords(self, conn: sqlite3.Connection | None = None) -> list[KeywordInterest]:
         """Get the list of keyword interests."""
-        with get_connection() as conn:
-            rows = conn.execute("SELECT * FROM keyword_interests ORDER BY weight DESC").fetchall()
+        with nullcontext(conn) if conn is not None else get_connection() as db:
+            rows = db.execute("SELECT * FROM keyword_interests ORDER BY weight DESC").fetchall()
 
             return [
                 KeywordInterest(
@@ -173,3 +175,10 @@ class PreferenceService:
                 )
                 for row in rows
             ]
+
+    def get_categories_and_keywords(
+        self,
+    ) -> tuple[list[PreferredCategory], list[KeywordInterest]]:
+        """Get categories and keywords together from one connection."""
+        with get_connection() as conn:
+            return self.get_categories(conn), self.get_keywords(conn)
@@ -1,12 +1,49 @@
 """AI provider abstraction."""
 
+import json
+import re
 import shlex
 import shutil
 import subprocess
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 
 from ..core.models import AIProviderType
 
+# Fenced blocks of an AI response, with their (possibly empty) language tag
+_FENCE_RE = re.compile(r"```([\w+-]*)[ \t]*\n?(.*?)```", re.DOTALL)
+
+
+def _json_fence(output: str) -> str | None:
+    """Body of the first ```json block, else of the first untagged block."""
+    untagged = None
+    for match in _FENCE_RE.finditer(output):
+        tag = match.group(1).lower()
+        if tag == "json":
+            return match.group(2)
+        if not tag and untagged is None:
+            untagged = match.group(2)
+    return untagged
+
+
+def extract_json(output: str):
+    """Parse the JSON payload of an AI response.
+
+    Accepts a bare JSON document, one wrapped in a code fence, or an object
+    surrounded by extra prose. A ```json fence wins over an untagged one, and
+    fences in other languages are ignored. Raises json.JSONDecodeError if
+    nothing parses.
+    """
+    fenced = _json_fence(output)
+    text = (output if fenced is None else fenced).strip()
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        start, end = text.find("{"), text.rfind("}")
+        if start == -1 or end <= start:
+            raise
+        return json.loads(text[start : end + 1])
+
 
 class AIProvider(ABC):
     """AI CLI provider base class."""
@@ -48,6 +85,25 @@ class AIProvider(ABC):
         except (subprocess.TimeoutExpired, Exception):
             return None
 
+    def with_config(self, model: str = "", timeout: int = 120) -> "ConfiguredProvider":
+        """Bind a model and timeout so callers only pass the prompt."""
+        return ConfiguredProvider(self, model, timeout)
+
+
+@dataclass(frozen=True)
+class ConfiguredProvider:
+    """A provider with its model and timeout resolved once."""
+
+    provider: AIProvider
+    model: str = ""
+    timeout: int = 120
+
+    def is_available(self) -> bool:
+        return self.provider.is_available()
+
+    def invoke(self, prompt: str) -> str | None:
+        return self.provider.invoke(prompt, model=self.model, timeout=self.timeout)
+
 
 class GeminiProvider(AIProvider):
     provider_type = AIProviderType.GEMINI
@@ -173,6 +173,14 @@ class ReadingListService:
             ).fetchall()
             return [_row_to_reading_list_paper(row) for row in rows]
 
+    def get_paper_counts(self) -> dict[int, int]:
+        """Number of papers in each non-empty list, keyed by list ID."""
+        with get_connection() as conn:
+            rows = conn.execute(
+                "SELECT list_id, COUNT(*) FROM reading_list_papers GROUP BY list_id"
+            ).fetchall()
+            return {row[0]: row[1] for row in rows}
+
     def remove_paper_from_list(self, list_id: int, arxiv_id: str) -> bool:
         """Remove a paper from a list by list ID."""
         with get_connection() as conn:
@@ -33,8 +33,8 @@ class RecommendationEngine:
         if not liked_papers:
             return None
 
-        # Combine paper text
-        documents = [f"{p.title} {p.abstract}" for p in liked_papers]
+        # Combine paper text (the vectorizer lowercases anyway)
+        documents = [p.search_text for p in liked_papers]
 
         # Compute TF-IDF vectors
         if not self._is_fitted:
@@ -67,16 +67,19 @@ class RecommendationEngine:
         max_priority = max((c.priority for c in preferred_categories), default=1)
         keyword_weights = {k.keyword: k.weight for k in keywords}
 
+        # Loop invariants
+        profile = user_profile.reshape(1, -1) if user_profile is not None else None
+        now = datetime.now()
+
         results = []
 
         for paper in papers:
             score = 0.0
 
             # 1. Content similarity (TF-IDF)
-            if user_profile is not None and self._is_fitted:
-                doc = f"{paper.title} {paper.abstract}"
-                paper_vector = self.vectorizer.transform([doc])
-                content_sim = cosine_similarity(user_profile.reshape(1, -1), paper_vector)[0, 0]
+            if profile is not None and self._is_fitted:
+                paper_vector = self.vectorizer.transform([paper.search_text])
+                content_sim = cosine_similarity(profile, paper_vector)[0, 0]
                 score += content_sim * content_weight
 
             # 2. Category matching
@@ -88,14 +91,14 @@ class RecommendationEngine:
                     break  # Use only the first match
 
             # 3. Keyword matching
-            text = f"{paper.title} {paper.abstract}".lower()
+            text = paper.search_text
             for keyword, weight in keyword_weights.items():
                 if keyword in text:
                     score += keyword_weight * (weight / 5.0)
 
             # 4. Recency bonus
             if use_recency:
-                days_old = (datetime.now() - paper.published).days
+                days_old = (now - paper.published).days
                 if days_old < 30:
                     recency_factor = 1 - (days_old / 30)
                     score += recency_weight * recency_factor
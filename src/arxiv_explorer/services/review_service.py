@@ -2,10 +2,14 @@
 
 import json
 import re
+import sqlite3
 import subprocess
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import nullcontext
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
 
 from ..core.database import get_connection
 from ..core.models import (
@@ -15,7 +19,7 @@ from ..core.models import (
     ReviewSection,
     ReviewSectionType,
 )
-from .providers import get_provider
+from .providers import ConfiguredProvider, extract_json, get_provider
 from .settings_service import SettingsService
 
 # Language display names for translation prompts
@@ -23,6 +27,98 @@ _LANG_NAMES: dict[Language, str] = {
     Language.KO: "Korean",
 }
 
+# Heading filters used to pick relevant paper sections for each prompt
+_METHOD_KW_RE = re.compile(r"method|approach|model|framework|algorithm|architecture", re.IGNORECASE)
+_EXP_KW_RE = re.compile(
+    r"experiment|result|evaluation|ablation|benchmark|performance", re.IGNORECASE
+)
+_REPRO_KW_RE = re.compile(
+    r"method|experiment|implementation|setup|training|hyperparameter|appendix", re.IGNORECASE
+)
+_RELATED_KW_RE = re.compile(r"related|background|prior|previous|literature", re.IGNORECASE)
+
+# Full-text extractors
+# ![caption](path) followed by *Figure N: caption*
+_FIG_IMG_RE = re.compile(r"!\[([^\]]*)\]\([^)]+\)\s*\n\*Figure\s+(\d+):\s*([^*]+)\*", re.MULTILINE)
+# **Figure N:** or *Figure N:* without image
+_FIG_TEXT_RE = re.compile(r"\*\*?Figure\s+(\d+)[:.]\*?\*?\s*(.+?)(?:\n|$)", re.MULTILINE)
+# Consecutive lines starting with |, plus an optional "Table N:" caption
+_TABLE_RE = re.compile(
+    r"((?:\|.+\|\n)+)(?:\s*\*?(?:\*?)Table\s+(\d+)[:.]\*?\*?\s*([^\n*]*))?", re.MULTILINE
+)
+_MATH_RE = re.compile(r"\$\$\s*\n?(.*?)\n?\s*\$\$", re.DOTALL)
+
+# Old-style IDs ("hep-th/9901001") become directory-safe names ("hep-th_9901001")
+_SAFE_ID = str.maketrans("/", "_")
+
+# arxiv-doc-builder converter shipped alongside the repository checkout
+_CONVERT_SCRIPT = (
+    Path(__file__).parents[3]
+    / ".claude"
+    / "skills"
+    / "arxiv-doc-builder"
+    / "scripts"
+    / "convert_paper.py"
+)
+
+
+# (head, tail) character spans of the full text quoted by the section prompts
+_EXCERPT_SPANS = ((4000, 0), (3000, 0), (5000, 0), (3000, 2000), (2500, 2500), (2000, 2000))
+
+
+def _excerpts(text: str | None) -> dict[tuple[int, int], str]:
+    """Head (and optional tail) excerpts of a paper's full text for prompt context.
+
+    Several section prompts quote the same spans, so they are sliced once per
+    review and looked up by ``(head, tail)``. Empty when there is no full text.
+    """
+    if not text:
+        return {}
+    return {
+        (head, tail): f"{text[:head]}\n...\n{text[-tail:]}" if tail else text[:head]
+        for head, tail in _EXCERPT_SPANS
+    }
+
+
+def _matching_sections(sections: dict[str, str] | None, heading_re: re.Pattern, limit: int) -> str:
+    """``### heading`` blocks, truncated to ``limit``, for sections whose heading matches."""
+    return "".join(
+        f"\n### {heading}\n{content[:limit]}\n"
+        for heading, content in (sections or {}).items()
+        if heading_re.search(heading)
+    )
+
+
+def _iter_h2_sections(markdown: str) -> Iterator[str]:
+    """Yield the preamble and then each ``## `` section, header included."""
+    section: list[str] = []
+    for line in markdown.splitlines(keepends=True):
+        if line.startswith("## ") and section:
+            yield "".join(section)
+            section = []
+        section.append(line)
+    if section:
+        yield "".join(section)
+
+
+_SECTION_COLUMNS = "id, arxiv_id, section_type, content_json, source_type, generated_at"
+# Built once so every lookup passes sqlite3 the identical string for its statement cache
+_SELECT_SECTIONS_SQL = f"SELECT {_SECTION_COLUMNS} FROM paper_review_sections WHERE arxiv_id = ?"
+_SELECT_SECTION_SQL = _SELECT_SECTIONS_SQL + " AND section_type = ?"
+# Plain dict lookup instead of calling ReviewSectionType(...) for every row
+_SECTION_TYPES = ReviewSectionType._value2member_map_
+
+
+def _row_to_section(row: sqlite3.Row) -> ReviewSection:
+    return ReviewSection(
+        id=row["id"],
+        arxiv_id=row["arxiv_id"],
+        section_type=_SECTION_TYPES[row["section_type"]],
+        content_json=row["content_json"],
+        source_type=row["source_type"],
+        generated_at=datetime.fromisoformat(row["generated_at"]),
+    )
+
 
 class PaperReviewService:
     """Generate comprehensive AI paper reviews with incremental caching."""
@@ -45,6 +141,10 @@ class PaperReviewService:
         (ReviewSectionType.QUESTIONS, False),
         (ReviewSectionType.READING_GUIDE, False),
     ]
+    _SECTION_ORDER: tuple[ReviewSectionType, ...] = tuple(st for st, _ in SECTION_PIPELINE)
+
+    # Upper bound on concurrent AI CLI invocations per review
+    MAX_PARALLEL_SECTIONS = 7
 
     # Shared reviewer persona prefix for all prompts
     _REVIEWER_PERSONA = (
@@ -56,19 +156,42 @@ class PaperReviewService:
         "Avoid vague praise or criticism — be precise and constructive.\n\n"
     )
 
+    def __init__(self) -> None:
+        # Provider bound to the configured model/timeout, shared by all section calls
+        self._provider: ConfiguredProvider | None = None
+        # Every cached section of a paper, as last read from the DB; dropped on write
+        self._section_cache: dict[str, dict[ReviewSectionType, ReviewSection]] = {}
+
     def generate_review(
         self,
         paper: Paper,
         force: bool = False,
         on_section_start: Optional[Callable[[ReviewSectionType, int, int], None]] = None,
         on_section_complete: Optional[Callable[[ReviewSectionType, bool], None]] = None,
+        bundle: bool = False,
     ) -> PaperReview | None:
-        """Generate a full review. Resumes from cache if interrupted."""
-        # Step 1: Attempt full text extraction
-        full_text_md = self._extract_full_text(paper.arxiv_id)
-        source_type = "full_text" if full_text_md else "abstract"
+        """Generate a full review. Resumes from cache if interrupted.
+
+        With ``bundle=True`` all uncached sections are first requested in a single
+        AI call; any section missing from that response falls back to its own call.
+        """
+        # Re-resolve the provider per review so settings changes between runs apply
+        self._provider = None
 
-        # Step 2: Pre-parse full text if available
+        # Step 1: Load existing cached sections
+        cached = self._get_all_cached_sections(paper.arxiv_id)
+
+        # Step 2: Attempt full text extraction, unless every section is already
+        # cached (extraction may run the arxiv-doc-builder converter)
+        if not force and all(st in cached for st in self._SECTION_ORDER):
+            full_text_md = None
+            from_full_text = any(s.source_type == "full_text" for s in cached.values())
+            source_type = "full_text" if from_full_text else "abstract"
+        else:
+            full_text_md = self._extract_full_text(paper.arxiv_id)
+            source_type = "full_text" if full_text_md else "abstract"
+
+        # Step 3: Pre-parse full text if available
         paper_sections = None
         figure_captions = None
         table_content = None
@@ -79,59 +202,118 @@ class PaperReviewService:
             table_content = self._extract_table_content(full_text_md)
             math_blocks = self._extract_math_blocks(full_text_md)
 
-        # Step 3: Load existing cached sections
-        cached = self._get_all_cached_sections(paper.arxiv_id)
+        # Paper header and full-text excerpts shared by every section prompt
+        header = self._build_header(paper)
+        excerpts = _excerpts(full_text_md)
 
-        # Step 4: Process each section
-        total = len(self.SECTION_PIPELINE)
-        sections_data: dict[ReviewSectionType, dict] = {}
-
-        for idx, (section_type, needs_full_text) in enumerate(self.SECTION_PIPELINE):
-            if on_section_start:
-                on_section_start(section_type, idx, total)
-
-            # Use cached if available and not forcing
-            if not force and section_type in cached:
-                sections_data[section_type] = json.loads(cached[section_type].content_json)
-                if on_section_complete:
-                    on_section_complete(section_type, True)
-                continue
-
-            # Skip data-dependent sections when no data exists
-            if needs_full_text and not full_text_md:
-                if section_type in (
-                    ReviewSectionType.FIGURES,
-                    ReviewSectionType.TABLES,
-                    ReviewSectionType.MATH_FORMULATIONS,
-                    ReviewSectionType.REPRODUCIBILITY,
-                ):
-                    empty = self._empty_section_data(section_type)
-                    sections_data[section_type] = empty
-                    self._save_section(paper.arxiv_id, section_type, empty, source_type)
+        # One connection for the whole review keeps its statement cache warm;
+        # each section is still committed on its own so interrupted runs resume.
+        with get_connection() as conn:
+            # Step 4: Process each section
+            total = len(self.SECTION_PIPELINE)
+            sections_data: dict[ReviewSectionType, dict] = {}
+            placeholders: list[tuple[ReviewSectionType, dict]] = []
+            pending: list[tuple[ReviewSectionType, str]] = []
+
+            # A section left out of a bundle is already reported when it falls back
+            started: set[ReviewSectionType] = set()
+
+            def start(section_type: ReviewSectionType) -> None:
+                if section_type in started:
+                    return
+                started.add(section_type)
+                if on_section_start:
+                    on_section_start(section_type, self._SECTION_ORDER.index(section_type), total)
+
+            for section_type, needs_full_text in self.SECTION_PIPELINE:
+                # Use cached if available and not forcing
+                if not force and section_type in cached:
+                    sections_data[section_type] = json.loads(cached[section_type].content_json)
                     if on_section_complete:
                         on_section_complete(section_type, True)
                     continue
 
-            # Build prompt and invoke AI
-            prompt = self._build_prompt(
-                section_type=section_type,
-                paper=paper,
-                full_text_md=full_text_md,
-                paper_sections=paper_sections,
-                figure_captions=figure_captions,
-                table_content=table_content,
-                math_blocks=math_blocks,
-            )
+                # Skip data-dependent sections when no data exists
+                if needs_full_text and not full_text_md:
+                    if section_type in (
+                        ReviewSectionType.FIGURES,
+                        ReviewSectionType.TABLES,
+                        ReviewSectionType.MATH_FORMULATIONS,
+                        ReviewSectionType.REPRODUCIBILITY,
+                    ):
+                        placeholders.append((section_type, self._empty_section_data(section_type)))
+                        continue
+
+                # Build prompt; the AI call itself is deferred to the parallel batch below
+                prompt = self._build_prompt(
+                    section_type=section_type,
+                    paper=paper,
+                    header=header,
+                    excerpts=excerpts,
+                    full_text_md=full_text_md,
+                    paper_sections=paper_sections,
+                    figure_captions=figure_captions,
+                    table_content=table_content,
+                    math_blocks=math_blocks,
+                )
+                pending.append((section_type, prompt))
 
-            data = self._invoke_ai(prompt)
-            if data:
-                sections_data[section_type] = data
-                self._save_section(paper.arxiv_id, section_type, data, source_type)
-                if on_section_complete:
-                    on_section_complete(section_type, True)
-            else:
-                if on_section_complete:
-                    on_section_complete(section_type, False)
+            # Placeholder sections need no AI call: save them in one transaction
+            if placeholders:
+                self._save_sections(paper.arxiv_id, placeholders, source_type, conn)
+                for section_type, empty in placeholders:
+                    sections_data[section_type] = empty
+                    if on_section_complete:
+                        on_section_complete(section_type, True)
+
+            # Step 5 (optional): one combined request for every pending section
+            if bundle and len(pending) > 1:
+                for section_type, _ in pending:
+                    start(section_type)
+                bundled = self._invoke_bundle(header, pending)
+                if bundled:
+                    self._save_sections(paper.arxiv_id, list(bundled.items()), source_type, conn)
+                    for section_type, data in bundled.items():
+                        sections_data[section_type] = data
+                        if on_section_complete:
+                            on_section_complete(section_type, True)
+                pending = [(st, prompt) for st, prompt in pending if st not in bundled]
+
+            # Step 6: Sections are independent, so invoke the AI for them concurrently.
+            # Each section is submitted only when a worker is free, so on_section_start
+            # reports real starts; callbacks and saves stay on the thread owning `conn`.
+            if pending:
+                self._get_provider()  # resolve once before fanning out
+                workers = min(self.MAX_PARALLEL_SECTIONS, len(pending))
+                queued = iter(pending)
+                in_flight: dict[Future, ReviewSectionType] = {}
+
+                def submit_next(executor: ThreadPoolExecutor) -> None:
+                    item = next(queued, None)
+                    if item is not None:
+                        section_type, prompt = item
+                        start(section_type)
+                        in_flight[executor.submit(self._invoke_ai, prompt)] = section_type
+
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    for _ in range(workers):
+                        submit_next(executor)
+                    while in_flight:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            section_type = in_flight.pop(future)
+                            data = future.result()
+                            if data:
+                                sections_data[section_type] = data
+                                self._save_section(
+                                    paper.arxiv_id, section_type, data, source_type, conn
+                                )
+                            if on_section_complete:
+                                on_section_complete(section_type, bool(data))
+                            submit_next(executor)
+
+        # Restore pipeline order (parallel results arrive in completion order)
+        sections_data = {st: sections_data[st] for st in self._SECTION_ORDER if st in sections_data}
 
         if not sections_data:
             return None
@@ -171,6 +353,7 @@ class PaperReviewService:
 
     def delete_review(self, arxiv_id: str) -> bool:
         """Delete all cached review sections for a paper."""
+        self._section_cache.pop(arxiv_id, None)
         with get_connection() as conn:
             cursor = conn.execute(
                 "DELETE FROM paper_review_sections WHERE arxiv_id = ?",
@@ -211,6 +394,18 @@ class PaperReviewService:
         language: Language = Language.EN,
     ) -> str:
         """Render a PaperReview into publication-quality Markdown."""
+        markdown = "\n".join(self._render_parts(review))
+
+        # --- Translation ---
+        if language != Language.EN:
+            translated = self._translate_markdown(markdown, language)
+            if translated:
+                return translated
+
+        return markdown
+
+    def _render_parts(self, review: PaperReview) -> list[str]:
+        """Render a PaperReview into Markdown lines/blocks, joined once by the caller."""
         parts: list[str] = []
         sw = review.sections.get(ReviewSectionType.STRENGTHS_WEAKNESSES, {})
         imp = review.sections.get(ReviewSectionType.IMPACT_SIGNIFICANCE, {})
@@ -676,15 +871,7 @@ class PaperReviewService:
             f"{len(review.sections)}/{len(ReviewSectionType)} sections*"
         )
 
-        markdown = "\n".join(parts)
-
-        # --- Translation ---
-        if language != Language.EN:
-            translated = self._translate_markdown(markdown, language)
-            if translated:
-                return translated
-
-        return markdown
+        return parts
 
     # ── Full Text Extraction ──────────────────────────────────────────
 
@@ -702,10 +889,11 @@ class PaperReviewService:
 
     def _find_existing_markdown(self, arxiv_id: str) -> Path | None:
         """Check standard locations for existing conversion output."""
-        normalized = arxiv_id.replace("/", "_")
+        normalized = arxiv_id.translate(_SAFE_ID)
+        cwd = Path.cwd()
         candidates = [
-            Path.cwd() / "papers" / normalized / f"{normalized}.md",
-            Path.cwd() / normalized / f"{normalized}.md",
+            cwd / "papers" / normalized / f"{normalized}.md",
+            cwd / normalized / f"{normalized}.md",
         ]
         for p in candidates:
             if p.exists():
@@ -714,18 +902,10 @@ class PaperReviewService:
 
     def _run_arxiv_doc_builder(self, arxiv_id: str) -> Path | None:
         """Run convert_paper.py, return output path on success."""
-        script_path = (
-            Path(__file__).parent.parent.parent.parent
-            / ".claude"
-            / "skills"
-            / "arxiv-doc-builder"
-            / "scripts"
-            / "convert_paper.py"
-        )
-        if not script_path.exists():
+        if not _CONVERT_SCRIPT.exists():
             return None
 
-        normalized = arxiv_id.replace("/", "_")
+        normalized = arxiv_id.translate(_SAFE_ID)
         output_dir = Path.cwd() / "papers"
 
         try:
@@ -733,7 +913,7 @@ class PaperReviewService:
                 [
                     "uv",
                     "run",
-                    str(script_path),
+                    str(_CONVERT_SCRIPT),
                     arxiv_id,
                     "--output-dir",
                     str(output_dir),
@@ -753,16 +933,19 @@ class PaperReviewService:
 
     def _split_into_sections(self, full_text_md: str) -> dict[str, str]:
         """Split markdown into named sections by ## headers."""
+        if "## " not in full_text_md:
+            return {"_preamble": full_text_md.strip()}
+
         sections: dict[str, str] = {}
         current_heading = "_preamble"
         current_lines: list[str] = []
 
         for line in full_text_md.split("\n"):
-            match = re.match(r"^## (.+)$", line)
-            if match:
+            # Plain prefix check instead of a regex match on every line
+            if line.startswith("## ") and len(line) > 3:
                 if current_lines:
                     sections[current_heading] = "\n".join(current_lines).strip()
-                current_heading = match.group(1).strip()
+                current_heading = line[3:].strip()
                 current_lines = []
             else:
                 current_lines.append(line)
@@ -774,49 +957,43 @@ class PaperReviewService:
 
     def _extract_figure_captions(self, full_text_md: str) -> list[dict[str, str]]:
         """Extract figure captions and surrounding context."""
-        figures: list[dict[str, str]] = []
+        if "Figure" not in full_text_md:
+            return []
+
+        # Keyed by figure number: the first caption found for a figure wins
+        figures: dict[str, dict[str, str]] = {}
 
         # Pattern 1: ![caption](path) followed by *Figure N: caption*
-        pattern1 = re.compile(
-            r"!\[([^\]]*)\]\([^)]+\)\s*\n\*Figure\s+(\d+):\s*([^*]+)\*",
-            re.MULTILINE,
-        )
-        for m in pattern1.finditer(full_text_md):
-            figures.append(
-                {
-                    "figure_id": m.group(2),
+        for m in _FIG_IMG_RE.finditer(full_text_md):
+            fid = m.group(2)
+            if fid not in figures:
+                figures[fid] = {
+                    "figure_id": fid,
                     "caption": m.group(3).strip(),
                     "context": full_text_md[max(0, m.start() - 200) : m.end() + 200],
                 }
-            )
 
         # Pattern 2: **Figure N:** or *Figure N:* without image
-        pattern2 = re.compile(r"\*\*?Figure\s+(\d+)[:.]\*?\*?\s*(.+?)(?:\n|$)", re.MULTILINE)
-        seen_ids = {f["figure_id"] for f in figures}
-        for m in pattern2.finditer(full_text_md):
+        for m in _FIG_TEXT_RE.finditer(full_text_md):
             fid = m.group(1)
-            if fid not in seen_ids:
-                figures.append(
-                    {
-                        "figure_id": fid,
-                        "caption": m.group(2).strip(),
-                        "context": full_text_md[max(0, m.start() - 200) : m.end() + 200],
-                    }
-                )
-                seen_ids.add(fid)
+            if fid not in figures:
+                figures[fid] = {
+                    "figure_id": fid,
+                    "caption": m.group(2).strip(),
+                    "context": full_text_md[max(0, m.start() - 200) : m.end() + 200],
+                }
 
-        return figures
+        return list(figures.values())
 
     def _extract_table_content(self, full_text_md: str) -> list[dict[str, str]]:
         """Extract markdown tables and their captions."""
+        if "|" not in full_text_md:
+            return []
+
         tables: list[dict[str, str]] = []
 
         # Find markdown table blocks (consecutive lines starting with |)
-        table_pattern = re.compile(
-            r"((?:\|.+\|\n)+)(?:\s*\*?(?:\*?)Table\s+(\d+)[:.]\*?\*?\s*([^\n*]*))?",
-            re.MULTILINE,
-        )
-        for i, m in enumerate(table_pattern.finditer(full_text_md), 1):
+        for i, m in enumerate(_TABLE_RE.finditer(full_text_md), 1):
             tables.append(
                 {
                     "table_id": m.group(2) or str(i),
@@ -828,11 +1005,23 @@ class PaperReviewService:
 
     def _extract_math_blocks(self, full_text_md: str) -> list[str]:
         """Extract display math blocks ($$...$$)."""
-        pattern = re.compile(r"\$\$\s*\n?(.*?)\n?\s*\$\$", re.DOTALL)
-        return [m.group(1).strip() for m in pattern.finditer(full_text_md)]
+        if "$$" not in full_text_md:
+            return []
+        return [m.group(1).strip() for m in _MATH_RE.finditer(full_text_md)]
 
     # ── Prompt Builders ───────────────────────────────────────────────
 
+    def _build_header(self, paper: Paper) -> str:
+        """Build the persona + paper metadata header shared by all section prompts."""
+        return (
+            f"{self._REVIEWER_PERSONA}"
+            f"Paper: {paper.title}\n"
+            f"Authors: {', '.join(paper.authors[:10])}\n"
+            f"arXiv ID: {paper.arxiv_id}\n"
+            f"Categories: {', '.join(paper.categories)}\n\n"
+            f"Abstract: {paper.abstract}"
+        )
+
     def _build_prompt(
         self,
         section_type: ReviewSectionType,
@@ -842,46 +1031,27 @@ class PaperReviewService:
         figure_captions: list[dict] | None,
         table_content: list[dict] | None,
         math_blocks: list[str] | None,
+        header: str | None = None,
+        excerpts: dict[tuple[int, int], str] | None = None,
     ) -> str:
         """Build the AI prompt for a given section type."""
-        header = (
-            f"{self._REVIEWER_PERSONA}"
-            f"Paper: {paper.title}\n"
-            f"Authors: {', '.join(paper.authors[:10])}\n"
-            f"arXiv ID: {paper.arxiv_id}\n"
-            f"Categories: {', '.join(paper.categories)}\n\n"
-            f"Abstract: {paper.abstract}"
-        )
+        if header is None:
+            header = self._build_header(paper)
+        if excerpts is None:
+            excerpts = _excerpts(full_text_md)
 
-        builders = {
-            ReviewSectionType.EXECUTIVE_SUMMARY: self._prompt_executive_summary,
-            ReviewSectionType.KEY_CONTRIBUTIONS: self._prompt_contributions,
-            ReviewSectionType.SECTION_SUMMARIES: self._prompt_section_summaries,
-            ReviewSectionType.METHODOLOGY: self._prompt_methodology,
-            ReviewSectionType.MATH_FORMULATIONS: self._prompt_math,
-            ReviewSectionType.FIGURES: self._prompt_figures,
-            ReviewSectionType.TABLES: self._prompt_tables,
-            ReviewSectionType.EXPERIMENTAL_RESULTS: self._prompt_experiments,
-            ReviewSectionType.REPRODUCIBILITY: self._prompt_reproducibility,
-            ReviewSectionType.STRENGTHS_WEAKNESSES: self._prompt_strengths_weaknesses,
-            ReviewSectionType.IMPACT_SIGNIFICANCE: self._prompt_impact_significance,
-            ReviewSectionType.RELATED_WORK: self._prompt_related_work,
-            ReviewSectionType.GLOSSARY: self._prompt_glossary,
-            ReviewSectionType.QUESTIONS: self._prompt_questions,
-            ReviewSectionType.READING_GUIDE: self._prompt_reading_guide,
-        }
-
-        return builders[section_type](
+        return self._PROMPT_BUILDERS[section_type](
+            self,
             header=header,
-            full_text_md=full_text_md,
+            excerpts=excerpts,
             paper_sections=paper_sections,
             figure_captions=figure_captions,
             table_content=table_content,
             math_blocks=math_blocks,
         )
 
-    def _prompt_executive_summary(self, header, full_text_md, **_) -> str:
-        context = full_text_md[:4000] if full_text_md else ""
+    def _prompt_executive_summary(self, header, excerpts, **_) -> str:
+        context = excerpts.get((4000, 0), "")
         context_block = f"Full text excerpt:\n{context}" if context else ""
         return f"""{header}
 
@@ -907,8 +1077,8 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     "one_sentence_verdict": "Single sentence balanced assessment capturing both promise and limitations"
 }}"""
 
-    def _prompt_contributions(self, header, full_text_md, **_) -> str:
-        context = full_text_md[:3000] if full_text_md else ""
+    def _prompt_contributions(self, header, excerpts, **_) -> str:
+        context = excerpts.get((3000, 0), "")
         context_block = f"Full text excerpt:\n{context}" if context else ""
         return f"""{header}
 
@@ -936,13 +1106,11 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 }}"""
 
     def _prompt_section_summaries(self, header, paper_sections, **_) -> str:
-        sections_text = ""
-        if paper_sections:
-            for heading, content in paper_sections.items():
-                if heading == "_preamble":
-                    continue
-                truncated = content[:1500]
-                sections_text += f"\n### {heading}\n{truncated}\n"
+        sections_text = "".join(
+            f"\n### {heading}\n{content[:1500]}\n"
+            for heading, content in (paper_sections or {}).items()
+            if heading != "_preamble"
+        )
 
         return f"""{header}
 
@@ -967,22 +1135,10 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     ]
 }}"""
 
-    def _prompt_methodology(self, header, paper_sections, full_text_md, **_) -> str:
-        method_text = ""
-        if paper_sections:
-            method_keywords = [
-                "method",
-                "approach",
-                "model",
-                "framework",
-                "algorithm",
-                "architecture",
-            ]
-            for heading, content in paper_sections.items():
-                if any(kw in heading.lower() for kw in method_keywords):
-                    method_text += f"\n### {heading}\n{content[:2000]}\n"
-        if not method_text and full_text_md:
-            method_text = full_text_md[:5000]
+    def _prompt_methodology(self, header, paper_sections, excerpts, **_) -> str:
+        method_text = _matching_sections(paper_sections, _METHOD_KW_RE, 2000)
+        if not method_text:
+            method_text = excerpts.get((5000, 0), "")
 
         return f"""{header}
 
@@ -1023,10 +1179,9 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 }}"""
 
     def _prompt_math(self, header, math_blocks, **_) -> str:
-        math_text = ""
-        if math_blocks:
-            for i, block in enumerate(math_blocks[:15], 1):
-                math_text += f"\nEquation {i}: {block}\n"
+        math_text = "".join(
+            f"\nEquation {i}: {block}\n" for i, block in enumerate((math_blocks or [])[:15], 1)
+        )
 
         return f"""{header}
 
@@ -1057,11 +1212,10 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 }}"""
 
     def _prompt_figures(self, header, figure_captions, **_) -> str:
-        figs_text = ""
-        if figure_captions:
-            for fig in figure_captions:
-                figs_text += f"\nFigure {fig['figure_id']}: {fig['caption']}\n"
-                figs_text += f"Context: {fig['context'][:300]}\n"
+        figs_text = "".join(
+            f"\nFigure {fig['figure_id']}: {fig['caption']}\nContext: {fig['context'][:300]}\n"
+            for fig in figure_captions or []
+        )
 
         return f"""{header}
 
@@ -1089,11 +1243,10 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 }}"""
 
     def _prompt_tables(self, header, table_content, **_) -> str:
-        tables_text = ""
-        if table_content:
-            for tbl in table_content:
-                tables_text += f"\nTable {tbl['table_id']}: {tbl['caption']}\n"
-                tables_text += f"{tbl['content'][:500]}\n"
+        tables_text = "".join(
+            f"\nTable {tbl['table_id']}: {tbl['caption']}\n{tbl['content'][:500]}\n"
+            for tbl in table_content or []
+        )
 
         return f"""{header}
 
@@ -1121,24 +1274,11 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 }}"""
 
     def _prompt_experiments(self, header, paper_sections, table_content, **_) -> str:
-        exp_text = ""
-        if paper_sections:
-            exp_keywords = [
-                "experiment",
-                "result",
-                "evaluation",
-                "ablation",
-                "benchmark",
-                "performance",
-            ]
-            for heading, content in paper_sections.items():
-                if any(kw in heading.lower() for kw in exp_keywords):
-                    exp_text += f"\n### {heading}\n{content[:2000]}\n"
-
-        tables_summary = ""
-        if table_content:
-            for tbl in table_content[:5]:
-                tables_summary += f"\nTable {tbl['table_id']}: {tbl['content'][:300]}\n"
+        exp_text = _matching_sections(paper_sections, _EXP_KW_RE, 2000)
+        tables_summary = "".join(
+            f"\nTable {tbl['table_id']}: {tbl['content'][:300]}\n"
+            for tbl in (table_content or [])[:5]
+        )
 
         return f"""{header}
 
@@ -1172,23 +1312,10 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     "notable_findings": ["Surprising or particularly strong/weak finding"]
 }}"""
 
-    def _prompt_reproducibility(self, header, paper_sections, full_text_md, **_) -> str:
-        method_text = ""
-        if paper_sections:
-            method_keywords = [
-                "method",
-                "experiment",
-                "implementation",
-                "setup",
-                "training",
-                "hyperparameter",
-                "appendix",
-            ]
-            for heading, content in paper_sections.items():
-                if any(kw in heading.lower() for kw in method_keywords):
-                    method_text += f"\n### {heading}\n{content[:1500]}\n"
-        if not method_text and full_text_md:
-            method_text = full_text_md[:4000]
+    def _prompt_reproducibility(self, header, paper_sections, excerpts, **_) -> str:
+        method_text = _matching_sections(paper_sections, _REPRO_KW_RE, 1500)
+        if not method_text:
+            method_text = excerpts.get((4000, 0), "")
 
         return f"""{header}
 
@@ -1219,10 +1346,8 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     "missing_details": ["Specific detail needed for reproducibility that is absent from the paper"]
 }}"""
 
-    def _prompt_strengths_weaknesses(self, header, full_text_md, **_) -> str:
-        context = ""
-        if full_text_md:
-            context = full_text_md[:3000] + "\n...\n" + full_text_md[-2000:]
+    def _prompt_strengths_weaknesses(self, header, excerpts, **_) -> str:
+        context = excerpts.get((3000, 2000), "")
         context_block = f"Paper content:\n{context}" if context else ""
 
         return f"""{header}
@@ -1271,11 +1396,9 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     "confidence": "high|medium|low — how confident you are in this assessment"
 }}"""
 
-    def _prompt_impact_significance(self, header, full_text_md, **_) -> str:
-        context = ""
-        if full_text_md:
-            # Read intro and conclusion for impact context
-            context = full_text_md[:2500] + "\n...\n" + full_text_md[-2500:]
+    def _prompt_impact_significance(self, header, excerpts, **_) -> str:
+        # Read intro and conclusion for impact context
+        context = excerpts.get((2500, 2500), "")
         context_block = f"Paper content:\n{context}" if context else ""
 
         return f"""{header}
@@ -1309,18 +1432,7 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 }}"""
 
     def _prompt_related_work(self, header, paper_sections, **_) -> str:
-        rw_text = ""
-        if paper_sections:
-            rw_keywords = [
-                "related",
-                "background",
-                "prior",
-                "previous",
-                "literature",
-            ]
-            for heading, content in paper_sections.items():
-                if any(kw in heading.lower() for kw in rw_keywords):
-                    rw_text += f"\n### {heading}\n{content[:2500]}\n"
+        rw_text = _matching_sections(paper_sections, _RELATED_KW_RE, 2500)
 
         return f"""{header}
 
@@ -1356,8 +1468,8 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     "positioning": "How the paper positions itself — is this positioning fair and well-supported?"
 }}"""
 
-    def _prompt_glossary(self, header, full_text_md, **_) -> str:
-        context = full_text_md[:5000] if full_text_md else ""
+    def _prompt_glossary(self, header, excerpts, **_) -> str:
+        context = excerpts.get((5000, 0), "")
         context_block = f"Paper content:\n{context}" if context else ""
 
         return f"""{header}
@@ -1381,10 +1493,8 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     ]
 }}"""
 
-    def _prompt_questions(self, header, full_text_md, **_) -> str:
-        context = ""
-        if full_text_md:
-            context = full_text_md[:2000] + "\n...\n" + full_text_md[-2000:]
+    def _prompt_questions(self, header, excerpts, **_) -> str:
+        context = excerpts.get((2000, 2000), "")
         context_block = f"Paper content:\n{context}" if context else ""
 
         return f"""{header}
@@ -1416,12 +1526,12 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     ]
 }}"""
 
-    def _prompt_reading_guide(self, header, full_text_md, paper_sections, **_) -> str:
+    def _prompt_reading_guide(self, header, excerpts, paper_sections, **_) -> str:
         sections_list = ""
         if paper_sections:
             sections_list = ", ".join(h for h in paper_sections.keys() if h != "_preamble")
 
-        context = full_text_md[:3000] if full_text_md else ""
+        context = excerpts.get((3000, 0), "")
         context_block = f"Paper structure:\n{context}" if context else ""
 
         return f"""{header}
@@ -1451,72 +1561,102 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
     "difficulty_level": "introductory|intermediate|advanced|expert"
 }}"""
 
+    # Section type -> prompt builder, resolved once at class creation
+    _PROMPT_BUILDERS: dict[ReviewSectionType, Callable[..., str]] = {
+        ReviewSectionType.EXECUTIVE_SUMMARY: _prompt_executive_summary,
+        ReviewSectionType.KEY_CONTRIBUTIONS: _prompt_contributions,
+        ReviewSectionType.SECTION_SUMMARIES: _prompt_section_summaries,
+        ReviewSectionType.METHODOLOGY: _prompt_methodology,
+        ReviewSectionType.MATH_FORMULATIONS: _prompt_math,
+        ReviewSectionType.FIGURES: _prompt_figures,
+        ReviewSectionType.TABLES: _prompt_tables,
+        ReviewSectionType.EXPERIMENTAL_RESULTS: _prompt_experiments,
+        ReviewSectionType.REPRODUCIBILITY: _prompt_reproducibility,
+        ReviewSectionType.STRENGTHS_WEAKNESSES: _prompt_strengths_weaknesses,
+        ReviewSectionType.IMPACT_SIGNIFICANCE: _prompt_impact_significance,
+        ReviewSectionType.RELATED_WORK: _prompt_related_work,
+        ReviewSectionType.GLOSSARY: _prompt_glossary,
+        ReviewSectionType.QUESTIONS: _prompt_questions,
+        ReviewSectionType.READING_GUIDE: _prompt_reading_guide,
+    }
+
     # ── AI Invocation ─────────────────────────────────────────────────
 
+    def _prompt_combined(self, header: str, pending: list[tuple[ReviewSectionType, str]]) -> str:
+        """Merge several section prompts into one request keyed by section type."""
+        tasks = "\n\n".join(
+            f"=== TASK: {section_type.value} ===\n{prompt.removeprefix(header).strip()}"
+            for section_type, prompt in pending
+        )
+        keys = ", ".join(f'"{section_type.value}"' for section_type, _ in pending)
+        return f"""{header}
+
+Complete each of the following review tasks. Every task describes its own JSON schema.
+
+{tasks}
+
+IMPORTANT: Respond ONLY with a single valid JSON object, no other text.
+Its keys must be exactly {keys}, and each value must be the JSON object requested by that task."""
+
+    def _invoke_bundle(
+        self, header: str, pending: list[tuple[ReviewSectionType, str]]
+    ) -> dict[ReviewSectionType, dict]:
+        """Request several sections in one AI call; returns only the valid ones."""
+        data = self._invoke_ai(self._prompt_combined(header, pending))
+        if not isinstance(data, dict):
+            return {}
+        result: dict[ReviewSectionType, dict] = {}
+        for section_type, _ in pending:
+            value = data.get(section_type.value)
+            if isinstance(value, dict) and value:
+                result[section_type] = value
+        return result
+
+    def _get_provider(self) -> ConfiguredProvider:
+        """Return the active provider with its model and timeout, resolving once."""
+        if self._provider is None:
+            ai = SettingsService().snapshot()
+            self._provider = get_provider(ai.provider).with_config(ai.model, ai.timeout)
+        return self._provider
+
     def _invoke_ai(self, prompt: str) -> dict | None:
         """Invoke AI provider, extract JSON, parse."""
-        settings = SettingsService()
-        provider = get_provider(settings.get_provider())
+        provider = self._get_provider()
         if not provider.is_available():
             return None
 
-        output = provider.invoke(
-            prompt,
-            model=settings.get_model(),
-            timeout=settings.get_timeout(),
-        )
+        output = provider.invoke(prompt)
         if output is None:
             return None
 
-        # Extract JSON block
-        if "```json" in output:
-            output = output.split("```json")[1].split("```")[0]
-        elif "```" in output:
-            output = output.split("```")[1].split("```")[0]
-
-        output = output.strip()
-
         try:
-            return json.loads(output)
+            return extract_json(output)
         except json.JSONDecodeError:
             return None
 
     # ── Cache Operations ──────────────────────────────────────────────
 
     def _get_cached_section(
-        self, arxiv_id: str, section_type: ReviewSectionType
+        self,
+        arxiv_id: str,
+        section_type: ReviewSectionType,
     ) -> ReviewSection | None:
+        known = self._section_cache.get(arxiv_id)
+        if known is not None:
+            return known.get(section_type)
+
         with get_connection() as conn:
-            row = conn.execute(
-                "SELECT * FROM paper_review_sections WHERE arxiv_id = ? AND section_type = ?",
-                (arxiv_id, section_type.value),
-            ).fetchone()
-            if row:
-                return ReviewSection(
-                    id=row["id"],
-                    arxiv_id=row["arxiv_id"],
-                    section_type=ReviewSectionType(row["section_type"]),
-                    content_json=row["content_json"],
-                    generated_at=datetime.fromisoformat(row["generated_at"]),
-                )
-        return None
+            row = conn.execute(_SELECT_SECTION_SQL, (arxiv_id, section_type.value)).fetchone()
+        return _row_to_section(row) if row else None
 
     def _get_all_cached_sections(self, arxiv_id: str) -> dict[ReviewSectionType, ReviewSection]:
-        with get_connection() as conn:
-            rows = conn.execute(
-                "SELECT * FROM paper_review_sections WHERE arxiv_id = ?",
-                (arxiv_id,),
-            ).fetchall()
-        return {
-            ReviewSectionType(row["section_type"]): ReviewSection(
-                id=row["id"],
-                arxiv_id=row["arxiv_id"],
-                section_type=ReviewSectionType(row["section_type"]),
-                content_json=row["content_json"],
-                generated_at=datetime.fromisoformat(row["generated_at"]),
-            )
-            for row in rows
-        }
+        known = self._section_cache.get(arxiv_id)
+        if known is None:
+            with get_connection() as conn:
+                rows = conn.execute(_SELECT_SECTIONS_SQL, (arxiv_id,)).fetchall()
+            sections = map(_row_to_section, rows)
+            known = self._section_cache[arxiv_id] = {s.section_type: s for s in sections}
+        return dict(known)
 
     def _save_section(
         self,
@@ -1524,20 +1664,41 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
         section_type: ReviewSectionType,
         data: dict,
         source_type: str,
+        conn: sqlite3.Connection | None = None,
     ) -> None:
-        with get_connection() as conn:
-            conn.execute(
-                """INSERT OR REPLACE INTO paper_review_sections
+        self._save_sections(arxiv_id, [(section_type, data)], source_type, conn)
+
+    def _save_sections(
+        self,
+        arxiv_id: str,
+        sections: list[tuple[ReviewSectionType, dict]],
+        source_type: str,
+        conn: sqlite3.Connection | None = None,
+    ) -> None:
+        """Upsert several sections with one executemany in a single transaction."""
+        self._section_cache.pop(arxiv_id, None)
+        rows = [
+            (
+                arxiv_id,
+                section_type.value,
+                json.dumps(data, ensure_ascii=False, separators=(",", ":")),
+                source_type,
+            )
+            for section_type, data in sections
+        ]
+        # Upsert in place: REPLACE would delete and re-insert the row (and its index entries)
+        with nullcontext(conn) if conn is not None else get_connection() as db:
+            db.executemany(
+                """INSERT INTO paper_review_sections
                    (arxiv_id, section_type, content_json, source_type)
-                   VALUES (?, ?, ?, ?)""",
-                (
-                    arxiv_id,
-                    section_type.value,
-                    json.dumps(data, ensure_ascii=False),
-                    source_type,
-                ),
+                   VALUES (?, ?, ?, ?)
+                   ON CONFLICT(arxiv_id, section_type) DO UPDATE SET
+                       content_json = excluded.content_json,
+                       source_type = excluded.source_type,
+                       generated_at = CURRENT_TIMESTAMP""",
+                rows,
             )
-            conn.commit()
+            db.commit()
 
     @staticmethod
     def _empty_section_data(section_type: ReviewSectionType) -> dict:
@@ -1562,30 +1723,39 @@ IMPORTANT: Respond ONLY with valid JSON, no other text.
 
     def _translate_markdown(self, markdown: str, target_language: Language) -> str | None:
         """Translate final markdown, chunking by ## headers if needed."""
+        # English → no-op, like TranslationService.translate
+        if target_language == Language.EN:
+            return markdown
+
         lang_name = _LANG_NAMES.get(target_language, target_language.value)
         max_chunk = 6000
 
         if len(markdown) <= max_chunk:
             return self._translate_chunk(markdown, lang_name)
 
-        # Split by ## headers to maintain structure
-        chunks = re.split(r"(^## .+$)", markdown, flags=re.MULTILINE)
-        translated_parts: list[str] = []
-        current_chunk = ""
+        # Pack whole ## sections into chunks so no chunk ends on a bare heading
+        chunks: list[str] = []
+        buf: list[str] = []
+        buf_len = 0
 
-        for chunk in chunks:
-            if len(current_chunk) + len(chunk) > max_chunk and current_chunk:
-                result = self._translate_chunk(current_chunk, lang_name)
-                translated_parts.append(result or current_chunk)
-                current_chunk = chunk
+        for section in _iter_h2_sections(markdown):
+            if buf_len + len(section) > max_chunk and buf:
+                chunks.append("".join(buf))
+                buf = [section]
+                buf_len = len(section)
             else:
-                current_chunk += chunk
+                buf.append(section)
+                buf_len += len(section)
 
-        if current_chunk:
-            result = self._translate_chunk(current_chunk, lang_name)
-            translated_parts.append(result or current_chunk)
+        if buf:
+            chunks.append("".join(buf))
 
-        return "".join(translated_parts)
+        # Chunks are independent: translate them concurrently, keeping document order
+        self._get_provider()  # resolve once before fanning out
+        workers = min(self.MAX_PARALLEL_SECTIONS, len(chunks))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = executor.map(self._translate_chunk, chunks, repeat(lang_name))
+            return "".join(result or chunk for chunk, result in zip(chunks, results, strict=True))
 
     def _translate_chunk(self, text: str, lang_name: str) -> str | None:
         """Translate a single chunk of markdown."""
@@ -1603,12 +1773,7 @@ Text to translate:
 
 Respond with ONLY the translated markdown, no other text."""
 
-        settings = SettingsService()
-        provider = get_provider(settings.get_provider())
+        provider = self._get_provider()
         if not provider.is_available():
             return None
-        return provider.invoke(
-            prompt,
-            model=settings.get_model(),
-            timeout=settings.get_timeout(),
-        )
+        return provider.invoke(prompt)
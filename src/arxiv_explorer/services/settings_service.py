@@ -1,6 +1,9 @@
 """App settings service."""
 
-from ..core.database import get_connection
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..core.database import get_connection, get_db_path
 from ..core.models import AIProviderType, Language
 
 DEFAULTS: dict[str, str] = {
@@ -19,6 +22,26 @@ WEIGHT_KEYS = ["content", "category", "keyword", "recency"]
 DEFAULT_WEIGHTS = {"content": 60, "category": 20, "keyword": 15, "recency": 5}
 
 
+@dataclass(frozen=True)
+class AISettings:
+    """Snapshot of the settings needed for every AI provider call."""
+
+    provider: str
+    model: str
+    timeout: int
+
+
+# Memoized reads, keyed by database path; cleared whenever settings are written
+_ai_snapshot: tuple[Path, AISettings] | None = None
+_values: dict[tuple[Path, str], str] = {}
+
+
+def _clear_cache() -> None:
+    global _ai_snapshot
+    _ai_snapshot = None
+    _values.clear()
+
+
 def adjust_weights(changed_key: str, new_value: int, weights: dict[str, int]) -> dict[str, int]:
     """Adjust all weights proportionally so they always sum to 100."""
     result = dict(weights)
@@ -45,11 +68,15 @@ class SettingsService:
 
     def get(self, key: str) -> str:
         """Get a setting value (returns default if not found)."""
+        cache_key = (get_db_path(), key)
+        if cache_key in _values:
+            return _values[cache_key]
+
         with get_connection() as conn:
             row = conn.execute("SELECT value FROM app_settings WHERE key = ?", (key,)).fetchone()
-            if row:
-                return row["value"]
-        return DEFAULTS.get(key, "")
+        value = row["value"] if row else DEFAULTS.get(key, "")
+        _values[cache_key] = value
+        return value
 
     def set(self, key: str, value: str) -> None:
         """Save a setting value."""
@@ -60,6 +87,7 @@ class SettingsService:
                 (key, value),
             )
             conn.commit()
+        _clear_cache()
 
     def get_all(self) -> dict[str, str]:
         """Get all settings (merged with defaults)."""
@@ -70,6 +98,30 @@ class SettingsService:
                 settings[row["key"]] = row["value"]
         return settings
 
+    def snapshot(self) -> AISettings:
+        """Provider, model and timeout in one lookup, memoized until the next write."""
+        global _ai_snapshot
+        db_path = get_db_path()
+        if _ai_snapshot is not None and _ai_snapshot[0] == db_path:
+            return _ai_snapshot[1]
+
+        keys = ("ai_provider", "ai_model", "ai_timeout")
+        values = {key: DEFAULTS[key] for key in keys}
+        with get_connection() as conn:
+            rows = conn.execute(
+                "SELECT key, value FROM app_settings WHERE key IN (?, ?, ?)", keys
+            ).fetchall()
+            for row in rows:
+                values[row["key"]] = row["value"]
+        try:
+            timeout = int(values["ai_timeout"])
+        except ValueError:
+            timeout = int(DEFAULTS["ai_timeout"])
+
+        snap = AISettings(provider=values["ai_provider"], model=values["ai_model"], timeout=timeout)
+        _ai_snapshot = (db_path, snap)
+        return snap
+
     def get_provider(self) -> str:
         """Return the active provider name as a string."""
         return self.get("ai_provider")
@@ -1,11 +1,13 @@
 """Summarization service using AI providers."""
 
 import json
+import sys
 from datetime import datetime
 
 from ..core.database import get_connection
 from ..core.models import PaperSummary
-from .providers import get_provider
+from .inflight import run_once
+from .providers import extract_json, get_provider
 from .settings_service import SettingsService
 
 
@@ -26,7 +28,16 @@ class SummarizationService:
                 else:
                     return cached
 
-        # Generate summary using AI provider
+        # Repeated requests for the same paper share one AI call
+        return run_once(
+            ("summary", arxiv_id, detailed),
+            lambda: self._generate(arxiv_id, title, abstract, detailed),
+        )
+
+    def _generate(
+        self, arxiv_id: str, title: str, abstract: str, detailed: bool
+    ) -> PaperSummary | None:
+        """Generate a summary with the AI provider and cache it."""
         if detailed:
             prompt = f"""Analyze the following academic paper and respond in JSON format:
 
@@ -60,36 +71,19 @@ Output only JSON in the following format (no other text):
 }}"""
 
         try:
-            settings = SettingsService()
-            provider = get_provider(settings.get_provider())
+            ai = SettingsService().snapshot()
+            provider = get_provider(ai.provider).with_config(ai.model, ai.timeout)
             if not provider.is_available():
-                import sys
-
                 print("Summary generation failed: provider not available", file=sys.stderr)
                 return None
-            output = provider.invoke(
-                prompt,
-                model=settings.get_model(),
-                timeout=settings.get_timeout(),
-            )
+            output = provider.invoke(prompt)
             if output is None:
-                import sys
-
                 print("Summary generation failed: provider returned no output", file=sys.stderr)
                 return None
-            # Extract JSON block (may be in ```json ... ``` format)
-            if "```json" in output:
-                output = output.split("```json")[1].split("```")[0]
-            elif "```" in output:
-                output = output.split("```")[1].split("```")[0]
-
-            output = output.strip()
 
             try:
-                data = json.loads(output)
+                data = extract_json(output)
             except json.JSONDecodeError as e:
-                import sys
-
                 print(f"Summary generation failed: JSON parse error: {e}", file=sys.stderr)
                 return None
 
@@ -108,8 +102,6 @@ Output only JSON in the following format (no other text):
             return summary
 
         except Exception as e:
-            import sys
-
             print(f"Summary generation failed: {e}", file=sys.stderr)
             return None
 
@@ -142,7 +134,7 @@ Output only JSON in the following format (no other text):
                     summary.arxiv_id,
                     summary.summary_short,
                     summary.summary_detailed,
-                    json.dumps(summary.key_findings),
+                    json.dumps(summary.key_findings, ensure_ascii=False, separators=(",", ":")),
                 ),
             )
             conn.commit()
@@ -1,11 +1,13 @@
 """Translation service using AI providers."""
 
 import json
+import sys
 from datetime import datetime
 
 from ..core.database import get_connection
 from ..core.models import Language, PaperTranslation
-from .providers import get_provider
+from .inflight import run_once
+from .providers import extract_json, get_provider
 from .settings_service import SettingsService
 
 # Language display names for prompts
@@ -46,6 +48,16 @@ class TranslationService:
             if cached:
                 return cached
 
+        # Repeated requests for the same paper share one AI call
+        return run_once(
+            ("translation", arxiv_id, target_language),
+            lambda: self._generate(arxiv_id, title, abstract, target_language),
+        )
+
+    def _generate(
+        self, arxiv_id: str, title: str, abstract: str, target_language: Language
+    ) -> PaperTranslation | None:
+        """Translate with the AI provider and cache the result."""
         lang_name = _LANG_NAMES.get(target_language, target_language.value)
 
         prompt = f"""Translate the following academic paper title and abstract into {lang_name}.
@@ -69,37 +81,19 @@ Respond in this exact JSON format:
 }}"""
 
         try:
-            settings = SettingsService()
-            provider = get_provider(settings.get_provider())
+            ai = SettingsService().snapshot()
+            provider = get_provider(ai.provider).with_config(ai.model, ai.timeout)
             if not provider.is_available():
-                import sys
-
                 print("Translation failed: provider not available", file=sys.stderr)
                 return None
-            output = provider.invoke(
-                prompt,
-                model=settings.get_model(),
-                timeout=settings.get_timeout(),
-            )
+            output = provider.invoke(prompt)
             if output is None:
-                import sys
-
                 print("Translation failed: provider returned no output", file=sys.stderr)
                 return None
 
-            # Extract JSON block
-            if "```json" in output:
-                output = output.split("```json")[1].split("```")[0]
-            elif "```" in output:
-                output = output.split("```")[1].split("```")[0]
-
-            output = output.strip()
-
             try:
-                data = json.loads(output)
+                data = extract_json(output)
             except json.JSONDecodeError as e:
-                import sys
-
                 print(f"Translation failed: JSON parse error: {e}", file=sys.stderr)
                 return None
 
@@ -116,8 +110,6 @@ Respond in this exact JSON format:
             return translation
 
         except Exception as e:
-            import sys
-
             print(f"Translation failed: {e}", file=sys.stderr)
             return None
 
@@ -133,7 +125,7 @@ Respond in this exact JSON format:
                 return PaperTranslation(
                     id=row["id"],
                     arxiv_id=row["arxiv_id"],
-                    target_language=Language(row["target_language"]),
+                    target_language=target_language,
                     translated_title=row["translated_title"],
                     translated_abstract=row["translated_abstract"],
                     generated_at=datetime.fromisoformat(row["generated_at"]),
@@ -1,14 +1,28 @@
 """Console output utilities."""
 
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group, RenderableType
 from rich.panel import Panel
 from rich.table import Table
+from rich.text import Text
 
-from ..core.models import Paper, PaperSummary, PaperTranslation, RecommendedPaper
+from ..core.models import (
+    Paper,
+    PaperSummary,
+    PaperTranslation,
+    PreferredCategory,
+    RecommendedPaper,
+)
 
 console = Console()
 
+# Fixed panel titles, parsed once (Panel copies a Text title before styling it)
+_SUMMARY_TITLE = Text("Summary", style="yellow")
+_DETAILED_SUMMARY_TITLE = Text("Detailed Summary", style="cyan")
+_ABSTRACT_TITLE = Text("Abstract", style="dim")
+_TRANSLATED_TITLE_TITLE = Text("Translated Title", style="magenta")
+_TRANSLATED_ABSTRACT_TITLE = Text("Translated Abstract", style="magenta")
+
 
 def print_paper_list(papers: list[RecommendedPaper], show_score: bool = True) -> None:
     """Display a list of papers."""
@@ -23,22 +37,27 @@ def print_paper_list(papers: list[RecommendedPaper], show_score: bool = True) ->
     table.add_column("arXiv ID", style="green", width=15)
     table.add_column("Title", width=50)
     table.add_column("Category", style="yellow", width=12)
+
+    # show_score is fixed for the whole table, so pick the row shape once
     if show_score:
         table.add_column("Score", style="magenta", width=6)
-
-    for i, rec in enumerate(papers, 1):
-        paper = rec.paper
-        title = paper.title[:47] + "..." if len(paper.title) > 50 else paper.title
-
-        row = [
-            str(i),
-            paper.arxiv_id,
-            title,
-            paper.primary_category,
+        rows = [
+            (
+                str(i),
+                rec.paper.arxiv_id,
+                rec.paper.display_title,
+                rec.paper.primary_category,
+                f"{rec.score:.2f}",
+            )
+            for i, rec in enumerate(papers, 1)
+        ]
+    else:
+        rows = [
+            (str(i), rec.paper.arxiv_id, rec.paper.display_title, rec.paper.primary_category)
+            for i, rec in enumerate(papers, 1)
         ]
-        if show_score:
-            row.append(f"{rec.score:.2f}")
 
+    for row in rows:
         table.add_row(*row)
 
     console.print(table)
@@ -50,81 +69,82 @@ def print_paper_detail(
     translation: PaperTranslation | None = None,
 ) -> None:
     """Display paper details."""
-    # Title
-    console.print(
+    # Collected into one Group so the whole view is rendered and written once
+    parts: list[RenderableType] = [
         Panel(
             f"[bold]{paper.title}[/bold]",
             title=f"[green]{paper.arxiv_id}[/green]",
             border_style="blue",
         )
-    )
+    ]
 
     # Metadata
-    console.print(f"[cyan]Authors:[/cyan] {', '.join(paper.authors[:5])}")
+    parts.append(f"[cyan]Authors:[/cyan] {paper.authors_display}")
     if len(paper.authors) > 5:
-        console.print(f"       and {len(paper.authors) - 5} more")
-    console.print(f"[cyan]Categories:[/cyan] {', '.join(paper.categories)}")
-    console.print(f"[cyan]Published:[/cyan] {paper.published.strftime('%Y-%m-%d')}")
+        parts.append(f"       and {len(paper.authors) - 5} more")
+    parts.append(f"[cyan]Categories:[/cyan] {paper.categories_display}")
+    parts.append(f"[cyan]Published:[/cyan] {paper.published_display}")
 
     # Summary
     if summary:
-        console.print()
-        console.print(
+        parts.append("")
+        parts.append(
             Panel(
                 summary.summary_short,
-                title="[yellow]Summary[/yellow]",
+                title=_SUMMARY_TITLE,
                 border_style="yellow",
             )
         )
 
         # Detailed summary
         if summary.summary_detailed:
-            console.print()
-            console.print(
+            parts.append("")
+            parts.append(
                 Panel(
                     summary.summary_detailed,
-                    title="[cyan]Detailed Summary[/cyan]",
+                    title=_DETAILED_SUMMARY_TITLE,
                     border_style="cyan",
                 )
             )
 
         if summary.key_findings:
-            console.print()
-            console.print("[yellow]Key Findings:[/yellow]")
-            for finding in summary.key_findings:
-                console.print(f"  • {finding}")
+            parts.append("")
+            parts.append("[yellow]Key Findings:[/yellow]")
+            parts.append("\n".join(f"  • {finding}" for finding in summary.key_findings))
 
     # Abstract
-    console.print()
-    console.print(
+    parts.append("")
+    parts.append(
         Panel(
             paper.abstract,
-            title="[dim]Abstract[/dim]",
+            title=_ABSTRACT_TITLE,
             border_style="dim",
         )
     )
 
     # Translation
     if translation:
-        console.print()
-        console.print(
+        parts.append("")
+        parts.append(
             Panel(
                 translation.translated_title,
-                title="[magenta]Translated Title[/magenta]",
+                title=_TRANSLATED_TITLE_TITLE,
                 border_style="magenta",
             )
         )
-        console.print()
-        console.print(
+        parts.append("")
+        parts.append(
             Panel(
                 translation.translated_abstract,
-                title="[magenta]Translated Abstract[/magenta]",
+                title=_TRANSLATED_ABSTRACT_TITLE,
                 border_style="magenta",
             )
         )
 
+    console.print(Group(*parts))
+
 
-def print_categories(categories: list) -> None:
+def print_categories(categories: list[PreferredCategory]) -> None:
     """Display category list."""
     table = Table(
         title="Preferred Categories",
@@ -134,12 +154,9 @@ def print_categories(categories: list) -> None:
     table.add_column("Priority", style="yellow")
     table.add_column("Added", style="dim")
 
-    for cat in categories:
-        table.add_row(
-            cat.category,
-            str(cat.priority),
-            cat.added_at.strftime("%Y-%m-%d"),
-        )
+    rows = [(cat.category, str(cat.priority), cat.added_display) for cat in categories]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
 
@@ -2,16 +2,17 @@
 
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator
 
 import pytest
 
 from arxiv_explorer.core.config import Config
-from arxiv_explorer.core.database import init_db
+from arxiv_explorer.core.database import close_pooled_connections, init_db
 from arxiv_explorer.core.models import KeywordInterest, Paper, PreferredCategory
 
 
 @pytest.fixture()
-def tmp_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Config:
+def tmp_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Config]:
     """Create an isolated Config pointing to a temp database."""
     db_path = tmp_path / "test.db"
     config = Config(
@@ -29,12 +30,13 @@ def tmp_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Config:
     monkeypatch.setattr("arxiv_explorer.core.config._config", config)
 
     init_db(db_path)
-    return config
+    yield config
+    close_pooled_connections()
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_paper() -> Paper:
-    """A minimal Paper for testing."""
+    """A minimal Paper for testing (shared across the session; do not mutate)."""
     return Paper(
         arxiv_id="2401.00001",
         title="Deep Learning for Particle Physics",
@@ -45,7 +47,7 @@ def sample_paper() -> Paper:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_papers() -> list[Paper]:
     """A list of diverse papers for recommendation testing."""
     return [
@@ -76,7 +78,7 @@ def sample_papers() -> list[Paper]:
     ]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_categories() -> list[PreferredCategory]:
     """Sample preferred categories for scoring tests."""
     return [
@@ -85,7 +87,7 @@ def sample_categories() -> list[PreferredCategory]:
     ]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def sample_keywords() -> list[KeywordInterest]:
     """Sample keywords for scoring tests."""
     return [
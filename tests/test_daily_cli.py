@@ -0,0 +1,70 @@
+"""Tests for the daily paper CLI commands."""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from arxiv_explorer.cli.daily import show
+
+app = typer.Typer()
+app.command()(show)
+
+
+@pytest.fixture
+def services(sample_paper):
+    with (
+        patch("arxiv_explorer.cli.daily.PaperService") as paper_service,
+        patch("arxiv_explorer.cli.daily.SummarizationService") as summarizer,
+        patch("arxiv_explorer.cli.daily.TranslationService") as translator,
+        patch("arxiv_explorer.cli.daily.print_paper_detail") as detail,
+    ):
+        paper_service.return_value.get_paper.return_value = sample_paper
+        yield summarizer.return_value, translator.return_value, detail
+
+
+class TestShowSummaryAndTranslation:
+    """Summary and translation requested together."""
+
+    def test_both_results_are_shown(self, services, sample_paper):
+        summarizer, translator, detail = services
+        result = CliRunner().invoke(app, [sample_paper.arxiv_id, "--summary", "--translate"])
+
+        assert result.exit_code == 0
+        translator.translate.assert_called_once_with(
+            sample_paper.arxiv_id, sample_paper.title, sample_paper.abstract, force=False
+        )
+        detail.assert_called_once_with(
+            sample_paper,
+            summarizer.summarize.return_value,
+            translator.translate.return_value,
+        )
+
+    def test_summary_failure_does_not_wait_for_translation(self, services, sample_paper):
+        summarizer, translator, detail = services
+        summarizer.summarize.return_value = None
+        release = threading.Event()
+        translator.translate.side_effect = lambda *a, **kw: release.wait(5)
+
+        started = time.monotonic()
+        result = CliRunner().invoke(app, [sample_paper.arxiv_id, "--summary", "--translate"])
+        elapsed = time.monotonic() - started
+        release.set()
+
+        assert result.exit_code == 1
+        assert elapsed < 1
+        translator.translate.assert_not_called()
+        detail.assert_not_called()
+
+    def test_summary_failure_skips_forced_translation(self, services, sample_paper):
+        summarizer, translator, _ = services
+        summarizer.summarize.return_value = None
+        result = CliRunner().invoke(
+            app, [sample_paper.arxiv_id, "--summary", "--translate", "--force"]
+        )
+
+        assert result.exit_code == 1
+        translator.translate.assert_not_called()
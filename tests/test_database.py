@@ -5,7 +5,7 @@ import sqlite3
 import pytest
 
 from arxiv_explorer.core.config import Config
-from arxiv_explorer.core.database import get_connection, init_db
+from arxiv_explorer.core.database import close_pooled_connections, get_connection, init_db
 
 EXPECTED_TABLES = {
     "preferred_categories",
@@ -50,6 +50,23 @@ class TestInitDb:
 
         assert tables == EXPECTED_TABLES
 
+    def test_enables_wal(self, tmp_config: Config):
+        with get_connection() as conn:
+            mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        assert mode == "wal"
+
+    def test_review_section_lookup_uses_index(self, tmp_config: Config):
+        """The UNIQUE(arxiv_id, section_type) constraint backs point lookups."""
+        with get_connection() as conn:
+            plan = conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM paper_review_sections "
+                "WHERE arxiv_id = ? AND section_type = ?",
+                ("2401.00001", "glossary"),
+            ).fetchall()
+        detail = " ".join(row["detail"] for row in plan)
+        assert "USING INDEX" in detail
+        assert "arxiv_id=? AND section_type=?" in detail
+
     def test_creates_indexes(self, tmp_config: Config):
         with get_connection() as conn:
             rows = conn.execute(
@@ -77,10 +94,31 @@ class TestGetConnection:
         with get_connection() as conn:
             assert conn.row_factory is sqlite3.Row
 
-    def test_connection_closes(self, tmp_config: Config):
-        """Connection should be closed after context manager exits."""
+    def test_connection_reused(self, tmp_config: Config):
+        """Sequential blocks should share one pooled connection."""
+        with get_connection() as first:
+            pass
+        with get_connection() as second:
+            assert second is first
+
+    def test_nested_connections_are_distinct(self, tmp_config: Config):
+        with get_connection() as outer, get_connection() as inner:
+            assert inner is not outer
+
+    @pytest.mark.parametrize("error", [RuntimeError, KeyboardInterrupt])
+    def test_rollback_before_reuse(self, tmp_config: Config, error: type[BaseException]):
+        """A failed block must not leak uncommitted writes to the next user."""
+        with pytest.raises(error), get_connection() as conn:
+            conn.execute("INSERT INTO preferred_categories (category) VALUES ('cs.AI')")
+            raise error
+
+        with get_connection() as conn:
+            assert conn.execute("SELECT COUNT(*) FROM preferred_categories").fetchone()[0] == 0
+
+    def test_close_pooled_connections(self, tmp_config: Config):
         with get_connection() as conn:
             pass
+        close_pooled_connections()
         # Attempting to use a closed connection raises ProgrammingError
         with pytest.raises(sqlite3.ProgrammingError):
             conn.execute("SELECT 1")
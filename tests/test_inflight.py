@@ -0,0 +1,45 @@
+"""Tests for in-flight request coalescing."""
+
+import threading
+
+import pytest
+
+from arxiv_explorer.services.inflight import run_once
+
+
+class TestRunOnce:
+    def test_concurrent_callers_share_one_call(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def work():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "summary"
+
+        results = []
+        owner = threading.Thread(target=lambda: results.append(run_once("k", work)))
+        owner.start()
+        started.wait(5)
+        waiter = threading.Thread(target=lambda: results.append(run_once("k", work)))
+        waiter.start()
+        release.set()
+        owner.join(5)
+        waiter.join(5)
+
+        assert results == ["summary", "summary"]
+        assert len(calls) == 1
+
+    def test_key_released_after_completion(self):
+        assert run_once("k", lambda: 1) == 1
+        assert run_once("k", lambda: 2) == 2
+
+    def test_exception_propagates_and_releases_key(self):
+        def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            run_once("k", fail)
+        assert run_once("k", lambda: "ok") == "ok"
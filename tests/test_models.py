@@ -9,6 +9,7 @@ from arxiv_explorer.core.models import (
     NoteType,
     Paper,
     PaperSummary,
+    PreferredCategory,
     ReadingListPaper,
     ReadingStatus,
     RecommendedPaper,
@@ -72,6 +73,31 @@ class TestPaper:
         assert paper.updated is None
         assert paper.pdf_url is None
 
+    def test_display_strings(self, sample_paper: Paper):
+        assert sample_paper.authors_display == "Alice, Bob"
+        assert sample_paper.categories_display == "hep-ph, cs.LG"
+        assert sample_paper.published_display == "2024-01-01"
+
+    def test_display_title_truncates_long_titles(self, sample_paper: Paper):
+        assert sample_paper.display_title == sample_paper.title
+        long = Paper(
+            arxiv_id="0000.00000",
+            title="x" * 60,
+            abstract="a",
+            authors=[],
+            categories=[],
+            published=datetime(2024, 1, 1),
+        )
+        assert long.display_title == "x" * 47 + "..."
+
+    def test_search_text_lowercased(self, sample_paper: Paper):
+        assert sample_paper.search_text.startswith("deep learning for particle physics we present")
+
+    def test_display_strings_excluded_from_equality(self, sample_paper: Paper):
+        copy = Paper(**{f: getattr(sample_paper, f) for f in sample_paper.__dataclass_fields__})
+        _ = sample_paper.authors_display
+        assert copy == sample_paper
+
 
 class TestDataclassDefaults:
     """Verify that dataclass default factories work correctly."""
@@ -91,6 +117,10 @@ class TestDataclassDefaults:
         assert ki.weight == 3
         assert ki.source == "explicit"
 
+    def test_preferred_category_added_display(self):
+        cat = PreferredCategory(id=1, category="cs.AI", added_at=datetime(2024, 3, 9, 15, 30))
+        assert cat.added_display == "2024-03-09"
+
     def test_recommended_paper_defaults(self, sample_paper: Paper):
         rp = RecommendedPaper(paper=sample_paper, score=0.75)
         assert rp.summary is None
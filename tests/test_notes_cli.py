@@ -0,0 +1,44 @@
+"""Tests for the notes CLI commands."""
+
+from datetime import datetime
+from unittest.mock import patch
+
+from typer.testing import CliRunner
+
+from arxiv_explorer.cli.notes import app
+from arxiv_explorer.core.models import NoteType, PaperNote
+
+
+def _note(note_id: int, arxiv_id: str, content: str, day: int) -> PaperNote:
+    return PaperNote(
+        id=note_id,
+        arxiv_id=arxiv_id,
+        note_type=NoteType.GENERAL,
+        content=content,
+        created_at=datetime(2024, 1, day),
+    )
+
+
+def test_list_keeps_newest_first_order():
+    # get_notes returns newest first; a header starts each run of one paper's notes
+    notes = [
+        _note(4, "2401.99999", "newest", 4),
+        _note(3, "2401.00001", "second", 3),
+        _note(2, "2401.00001", "older", 2),
+        _note(1, "2401.99999", "oldest", 1),
+    ]
+    with patch("arxiv_explorer.cli.notes.NotesService") as service:
+        service.return_value.get_notes.return_value = notes
+        result = CliRunner().invoke(app, ["list"])
+
+    assert result.exit_code == 0
+    lines = [line.strip() for line in result.output.splitlines() if line.strip()]
+    assert lines == [
+        "2401.99999",
+        "newest...",
+        "2401.00001",
+        "second...",
+        "older...",
+        "2401.99999",
+        "oldest...",
+    ]
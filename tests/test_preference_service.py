@@ -134,3 +134,12 @@ class TestKeywordManagement:
     def test_remove_nonexistent_keyword(self, tmp_config: Config):
         service = PreferenceService()
         assert service.remove_keyword("nonexistent") is False
+
+    def test_get_categories_and_keywords(self, tmp_config: Config):
+        service = PreferenceService()
+        service.add_category("hep-ph", priority=2)
+        service.add_keyword("jet", weight=4)
+
+        categories, keywords = service.get_categories_and_keywords()
+        assert [c.category for c in categories] == ["hep-ph"]
+        assert [k.keyword for k in keywords] == ["jet"]
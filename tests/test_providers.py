@@ -0,0 +1,54 @@
+"""Tests for AI provider helpers."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from arxiv_explorer.services.providers import ConfiguredProvider, GeminiProvider, extract_json
+
+
+class TestExtractJson:
+    def test_bare_json(self):
+        assert extract_json('{"a": 1}') == {"a": 1}
+
+    def test_json_fence(self):
+        assert extract_json('Here you go:\n```json\n{"a": 1}\n```\nDone.') == {"a": 1}
+
+    def test_plain_fence(self):
+        assert extract_json('```\n{"a": [1, 2]}\n```') == {"a": [1, 2]}
+
+    def test_uppercase_fence(self):
+        assert extract_json('```JSON\n{"a": 1}\n```') == {"a": 1}
+
+    def test_json_fence_preferred_over_other_fences(self):
+        output = '```python\nprint({"x": 0})\n```\n```\n{"b": 2}\n```\n```json\n{"a": 1}\n```'
+        assert extract_json(output) == {"a": 1}
+
+    def test_untagged_fence_preferred_over_other_languages(self):
+        output = '```text\nnot json\n```\n```\n{"a": 1}\n```'
+        assert extract_json(output) == {"a": 1}
+
+    def test_object_surrounded_by_prose(self):
+        assert extract_json('Sure! {"a": {"b": 2}} Hope this helps.') == {"a": {"b": 2}}
+
+    def test_unclosed_fence(self):
+        assert extract_json('```json\n{"a": 1}') == {"a": 1}
+
+    def test_invalid_raises(self):
+        with pytest.raises(json.JSONDecodeError):
+            extract_json("no json here")
+
+
+class TestConfiguredProvider:
+    def test_invoke_passes_bound_config(self):
+        provider = MagicMock()
+        provider.invoke.return_value = "out"
+        bound = ConfiguredProvider(provider, model="m", timeout=5)
+        assert bound.invoke("hi") == "out"
+        provider.invoke.assert_called_once_with("hi", model="m", timeout=5)
+
+    def test_with_config(self):
+        bound = GeminiProvider().with_config("gemini-pro", 30)
+        assert (bound.model, bound.timeout) == ("gemini-pro", 30)
+        assert isinstance(bound.provider, GeminiProvider)
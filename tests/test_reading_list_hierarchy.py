@@ -203,6 +203,17 @@ class TestMoveAndCopy:
         assert len(papers) == 1
 
 
+class TestPaperCounts:
+    def test_counts_by_list_id(self, svc):
+        a = svc.create_list("A")
+        b = svc.create_list("B")
+        svc.create_list("Empty")
+        svc.add_paper_to_list(a.id, "2401.00001")
+        svc.add_paper_to_list(a.id, "2401.00002")
+        svc.add_paper_to_list(b.id, "2401.00001")
+        assert svc.get_paper_counts() == {a.id: 2, b.id: 1}
+
+
 class TestMonthFolderToggle:
     def test_toggle_adds_paper(self, svc):
         added = svc.toggle_paper_in_month_folder("2401.00001", date(2026, 4, 6))
@@ -0,0 +1,8 @@
+"""Tests for the review CLI command."""
+
+from arxiv_explorer.cli.review import _SECTION_NAMES
+from arxiv_explorer.core.models import ReviewSectionType
+
+
+def test_section_names_cover_every_section():
+    assert set(_SECTION_NAMES) == set(ReviewSectionType)
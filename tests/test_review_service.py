@@ -1,16 +1,19 @@
 """Tests for the paper review service."""
 
 import json
-from unittest.mock import MagicMock
+import threading
+from unittest.mock import ANY, MagicMock
 
 import pytest
 
 from arxiv_explorer.core.config import Config
 from arxiv_explorer.core.models import (
+    Language,
     PaperReview,
     ReviewSectionType,
 )
-from arxiv_explorer.services.review_service import PaperReviewService
+from arxiv_explorer.services.providers import ConfiguredProvider
+from arxiv_explorer.services.review_service import PaperReviewService, _iter_h2_sections
 
 # ── Fixtures ──────────────────────────────────────────────────────────
 
@@ -111,6 +114,14 @@ class TestSectionSplitting:
         assert "_preamble" in sections
         assert "Just some text" in sections["_preamble"]
 
+    def test_finds_old_style_id_markdown(self, review_service, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        paper_dir = tmp_path / "papers" / "hep-th_9901001"
+        paper_dir.mkdir(parents=True)
+        (paper_dir / "hep-th_9901001.md").write_text("# Old paper")
+        found = review_service._find_existing_markdown("hep-th/9901001")
+        assert found == paper_dir / "hep-th_9901001.md"
+
 
 # ── Figure Caption Extraction Tests ───────────────────────────────────
 
@@ -139,6 +150,11 @@ class TestFigureCaptionExtraction:
         ids = [f["figure_id"] for f in figures]
         assert len(ids) == len(set(ids))
 
+    def test_repeated_image_figure_keeps_first(self, review_service):
+        text = "![a](a.png)\n*Figure 1: First*\n\n![b](b.png)\n*Figure 1: Again*\n"
+        figures = review_service._extract_figure_captions(text)
+        assert [f["caption"] for f in figures] == ["First"]
+
 
 # ── Table Extraction Tests ────────────────────────────────────────────
 
@@ -230,6 +246,42 @@ class TestReviewCaching:
         )
         assert json.loads(cached.content_json)["tldr"] == "new"
 
+    def test_cache_update_keeps_row(self, tmp_config: Config, review_service):
+        st = ReviewSectionType.EXECUTIVE_SUMMARY
+        review_service._save_section("2401.00001", st, {"tldr": "old"}, "abstract")
+        first = review_service._get_cached_section("2401.00001", st)
+        review_service._save_section("2401.00001", st, {"tldr": "new"}, "full_text")
+        second = review_service._get_cached_section("2401.00001", st)
+        assert second.id == first.id
+        assert len(review_service._get_all_cached_sections("2401.00001")) == 1
+
+    def test_section_cache_invalidated_on_save(self, tmp_config: Config, review_service):
+        st = ReviewSectionType.GLOSSARY
+        assert review_service._get_all_cached_sections("2401.00001") == {}
+        review_service._save_section("2401.00001", st, {"terms": []}, "abstract")
+        assert st in review_service._get_all_cached_sections("2401.00001")
+        assert review_service.delete_review("2401.00001")
+        assert review_service._get_cached_section("2401.00001", st) is None
+
+    def test_saved_json_is_compact_utf8(self, tmp_config: Config, review_service):
+        review_service._save_section(
+            "2401.00001", ReviewSectionType.GLOSSARY, {"terms": ["양자"]}, "abstract"
+        )
+        cached = review_service._get_cached_section("2401.00001", ReviewSectionType.GLOSSARY)
+        assert cached.content_json == '{"terms":["양자"]}'
+
+    def test_save_sections_bulk(self, tmp_config: Config, review_service):
+        review_service._save_sections(
+            "2401.00001",
+            [
+                (ReviewSectionType.FIGURES, {"figures": []}),
+                (ReviewSectionType.TABLES, {"tables": []}),
+            ],
+            "abstract",
+        )
+        all_cached = review_service._get_all_cached_sections("2401.00001")
+        assert set(all_cached) == {ReviewSectionType.FIGURES, ReviewSectionType.TABLES}
+
     def test_delete_review(self, tmp_config: Config, review_service):
         review_service._save_section(
             "2401.00001",
@@ -553,6 +605,22 @@ class TestGenerateReviewMocked:
         # - 4 empty sections in abstract-only mode (figures, tables, math, reproducibility)
         assert len(invoke_calls) == len(ReviewSectionType) - 1 - 4
 
+    def test_fully_cached_skips_full_text(self, tmp_config: Config, sample_paper):
+        service = PaperReviewService()
+        service._save_sections(
+            sample_paper.arxiv_id,
+            list(self._mock_responses().items()),
+            "full_text",
+        )
+        service._extract_full_text = MagicMock(return_value="# Paper")
+        service._invoke_ai = MagicMock()
+
+        review = service.generate_review(sample_paper)
+        assert review.is_complete
+        assert review.source_type == "full_text"
+        service._extract_full_text.assert_not_called()
+        service._invoke_ai.assert_not_called()
+
     def test_force_regenerates_cached(self, tmp_config: Config, sample_paper):
         service = PaperReviewService()
         service._extract_full_text = MagicMock(return_value=None)
@@ -565,6 +633,9 @@ class TestGenerateReviewMocked:
             "abstract",
         )
 
+        # The call-order-based mock needs the AI calls dispatched serially
+        service.MAX_PARALLEL_SECTIONS = 1
+
         responses = self._mock_responses()
         section_order = [st for st, _ in service.SECTION_PIPELINE]
         call_count = [0]
@@ -611,10 +682,112 @@ class TestGenerateReviewMocked:
             on_section_start=on_start,
             on_section_complete=on_complete,
         )
-        assert len(start_calls) == len(ReviewSectionType)
+        # Placeholder sections (figures, tables, math, reproducibility) never start
+        assert len(start_calls) == len(ReviewSectionType) - 4
+        assert ReviewSectionType.FIGURES not in {st for st, _, _ in start_calls}
         assert len(complete_calls) == len(ReviewSectionType)
         assert all(s for _, s in complete_calls)
 
+    def test_callbacks_invoked_with_partial_bundle(self, tmp_config: Config, sample_paper):
+        service = PaperReviewService()
+        service._extract_full_text = MagicMock(return_value=None)
+        # The bundle answers only the glossary; every other section falls back
+        service._invoke_ai = MagicMock(
+            side_effect=[{"glossary": {"terms": []}}] + [{"dummy": "data"}] * 20
+        )
+
+        start_calls: list[ReviewSectionType] = []
+        complete_calls: list[tuple] = []
+        service.generate_review(
+            sample_paper,
+            on_section_start=lambda st, idx, total: start_calls.append(st),
+            on_section_complete=lambda st, ok: complete_calls.append((st, ok)),
+            bundle=True,
+        )
+        # Each dispatched section is reported once, bundled or not
+        assert len(start_calls) == len(set(start_calls)) == len(ReviewSectionType) - 4
+        assert len(complete_calls) == len(ReviewSectionType)
+        assert all(ok for _, ok in complete_calls)
+
+    def test_start_reported_when_section_runs(self, tmp_config: Config, sample_paper):
+        service = PaperReviewService()
+        service._extract_full_text = MagicMock(return_value=None)
+        service._invoke_ai = MagicMock(return_value={"dummy": "data"})
+        service.MAX_PARALLEL_SECTIONS = 1
+        service._save_section(
+            sample_paper.arxiv_id, ReviewSectionType.GLOSSARY, {"terms": []}, "abstract"
+        )
+
+        events: list[tuple[str, ReviewSectionType]] = []
+        service.generate_review(
+            sample_paper,
+            on_section_start=lambda st, idx, total: events.append(("start", st)),
+            on_section_complete=lambda st, ok: events.append(("done", st)),
+        )
+
+        started = [st for kind, st in events if kind == "start"]
+        assert ReviewSectionType.GLOSSARY not in started
+        # With one worker, each section starts only after the previous one finished
+        ai_events = [e for e in events if e[1] in started]
+        assert ai_events == [(kind, st) for st in started for kind in ("start", "done")]
+
+    def test_sections_invoked_concurrently(self, tmp_config: Config, sample_paper):
+        service = PaperReviewService()
+        service._extract_full_text = MagicMock(return_value=None)
+        service.MAX_PARALLEL_SECTIONS = len(ReviewSectionType)
+
+        # Every AI call blocks until all of them are in flight; serial dispatch would time out
+        barrier = threading.Barrier(len(ReviewSectionType) - 4, timeout=5)
+
+        def mock_invoke(prompt):
+            barrier.wait()
+            return {"dummy": "data"}
+
+        service._invoke_ai = mock_invoke
+
+        review = service.generate_review(sample_paper)
+        assert len(review.sections) == len(ReviewSectionType)
+        # Sections come back in pipeline order regardless of completion order
+        assert list(review.sections) == [st for st, _ in service.SECTION_PIPELINE]
+
+    def test_bundle_single_call(self, tmp_config: Config, sample_paper):
+        service = PaperReviewService()
+        service._extract_full_text = MagicMock(return_value=None)
+        responses = self._mock_responses()
+        prompts: list[str] = []
+
+        def mock_invoke(prompt):
+            prompts.append(prompt)
+            return {st.value: data for st, data in responses.items()}
+
+        service._invoke_ai = mock_invoke
+
+        review = service.generate_review(sample_paper, bundle=True)
+        assert len(prompts) == 1
+        assert '"executive_summary"' in prompts[0]
+        assert review.sections[ReviewSectionType.EXECUTIVE_SUMMARY]["tldr"] == "Test"
+        cached = service._get_all_cached_sections(sample_paper.arxiv_id)
+        assert len(cached) == len(ReviewSectionType)
+
+    def test_bundle_falls_back_per_section(self, tmp_config: Config, sample_paper):
+        service = PaperReviewService()
+        service._extract_full_text = MagicMock(return_value=None)
+        prompts: list[str] = []
+
+        def mock_invoke(prompt):
+            prompts.append(prompt)
+            if len(prompts) == 1:
+                # Bundle answers only one section; the rest must be requested individually
+                return {"glossary": {"terms": []}}
+            return {"dummy": "data"}
+
+        service._invoke_ai = mock_invoke
+
+        review = service.generate_review(sample_paper, bundle=True)
+        assert review.sections[ReviewSectionType.GLOSSARY] == {"terms": []}
+        # 1 bundle + every AI section except the glossary
+        assert len(prompts) == 1 + len(ReviewSectionType) - 4 - 1
+
     def test_returns_none_on_total_failure(self, tmp_config: Config, sample_paper):
         service = PaperReviewService()
         service._extract_full_text = MagicMock(return_value=None)
@@ -679,18 +852,94 @@ class TestPromptBuilders:
 class TestEmptySectionData:
     """Test _empty_section_data returns correct structures."""
 
-    def test_figures_empty(self):
-        data = PaperReviewService._empty_section_data(ReviewSectionType.FIGURES)
-        assert data == {"figures": []}
+    @pytest.mark.parametrize(
+        ("section_type", "expected"),
+        [
+            (ReviewSectionType.FIGURES, {"figures": []}),
+            (ReviewSectionType.TABLES, {"tables": []}),
+            (ReviewSectionType.MATH_FORMULATIONS, {"formulations": []}),
+            (ReviewSectionType.EXECUTIVE_SUMMARY, {}),
+        ],
+    )
+    def test_empty_data(self, section_type, expected):
+        assert PaperReviewService._empty_section_data(section_type) == expected
+
+
+# ── Provider Resolution Tests ─────────────────────────────────────────
 
-    def test_tables_empty(self):
-        data = PaperReviewService._empty_section_data(ReviewSectionType.TABLES)
-        assert data == {"tables": []}
 
-    def test_math_empty(self):
-        data = PaperReviewService._empty_section_data(ReviewSectionType.MATH_FORMULATIONS)
-        assert data == {"formulations": []}
+class TestProviderResolution:
+    """The AI provider is resolved once and reused for every section."""
 
-    def test_other_empty(self):
-        data = PaperReviewService._empty_section_data(ReviewSectionType.EXECUTIVE_SUMMARY)
-        assert data == {}
+    def test_provider_resolved_once_per_review(self, tmp_config: Config, sample_paper, monkeypatch):
+        provider = MagicMock()
+        provider.is_available.return_value = True
+        provider.invoke.return_value = '{"ok": true}'
+        provider.with_config.side_effect = lambda model, timeout: ConfiguredProvider(
+            provider, model, timeout
+        )
+        get_provider = MagicMock(return_value=provider)
+        monkeypatch.setattr("arxiv_explorer.services.review_service.get_provider", get_provider)
+
+        service = PaperReviewService()
+        service._extract_full_text = MagicMock(return_value=None)
+        service.generate_review(sample_paper)
+
+        assert get_provider.call_count == 1
+        assert provider.invoke.call_count == len(ReviewSectionType) - 4
+        provider.invoke.assert_called_with(ANY, model="", timeout=120)
+
+
+# ── Markdown Translation Tests ────────────────────────────────────────
+
+
+class TestTranslateMarkdown:
+    """Chunked translation of rendered reviews."""
+
+    def _long_markdown(self) -> str:
+        body = "word " * 400
+        return "# Title\n\n" + "".join(f"## Section {i}\n\n{body}\n" for i in range(8))
+
+    def test_short_markdown_single_chunk(self, tmp_config: Config, review_service):
+        review_service._translate_chunk = MagicMock(return_value="번역")
+        assert review_service._translate_markdown("# Short", Language.KO) == "번역"
+        review_service._translate_chunk.assert_called_once()
+
+    def test_english_skips_ai(self, review_service):
+        review_service._translate_chunk = MagicMock()
+        assert review_service._translate_markdown("# Title", Language.EN) == "# Title"
+        review_service._translate_chunk.assert_not_called()
+
+    def test_iter_h2_sections(self):
+        markdown = "# T\nintro\n## A\na\n### sub\n## B\nb"
+        assert list(_iter_h2_sections(markdown)) == [
+            "# T\nintro\n",
+            "## A\na\n### sub\n",
+            "## B\nb",
+        ]
+
+    def test_chunks_keep_headers_with_bodies(self, tmp_config: Config, review_service):
+        chunks: list[str] = []
+        lock = threading.Lock()
+
+        def fake_translate(text, lang_name):
+            with lock:
+                chunks.append(text)
+            return text.upper()
+
+        review_service._translate_chunk = fake_translate
+        markdown = self._long_markdown()
+        result = review_service._translate_markdown(markdown, Language.KO)
+
+        assert len(chunks) > 1
+        assert all(len(c) <= 6000 for c in chunks)
+        for chunk in chunks:
+            assert not chunk.rstrip().endswith(("## Section", "\n##"))
+            assert chunk.startswith("# Title") or chunk.startswith("## Section")
+        # Document order is preserved even though chunks translate concurrently
+        assert result == markdown.upper()
+
+    def test_failed_chunk_keeps_original(self, tmp_config: Config, review_service):
+        review_service._translate_chunk = MagicMock(return_value=None)
+        markdown = self._long_markdown()
+        assert review_service._translate_markdown(markdown, Language.KO) == markdown
@@ -0,0 +1,70 @@
+"""Tests for the settings service caches."""
+
+from unittest.mock import patch
+
+import pytest
+
+from arxiv_explorer.core.config import Config
+from arxiv_explorer.core.database import init_db
+from arxiv_explorer.services import settings_service
+from arxiv_explorer.services.settings_service import SettingsService
+
+
+@pytest.fixture(autouse=True)
+def _reset_cache():
+    """Keep the module-level settings caches from leaking between tests."""
+    settings_service._clear_cache()
+    yield
+    settings_service._clear_cache()
+
+
+@pytest.fixture
+def svc(tmp_config: Config) -> SettingsService:
+    return SettingsService()
+
+
+class TestAISnapshot:
+    """Memoized AI provider settings."""
+
+    def test_defaults(self, svc):
+        snap = svc.snapshot()
+        assert snap.provider == "gemini"
+        assert snap.model == ""
+        assert snap.timeout == 120
+
+    def test_memoized(self, svc):
+        assert svc.snapshot() is svc.snapshot()
+
+    def test_set_invalidates(self, svc):
+        svc.snapshot()
+        svc.set("ai_provider", "claude")
+        svc.set("ai_timeout", "30")
+        snap = svc.snapshot()
+        assert snap.provider == "claude"
+        assert snap.timeout == 30
+
+    def test_invalid_timeout_falls_back(self, svc):
+        svc.set("ai_timeout", "soon")
+        assert svc.snapshot().timeout == 120
+
+    def test_keyed_by_database(self, svc, tmp_path):
+        svc.set("ai_model", "first")
+        assert svc.snapshot().model == "first"
+
+        other = tmp_path / "other.db"
+        init_db(other)
+        config = Config(db_path=other, arxivterminal_db_path=tmp_path / "at.db")
+        with patch("arxiv_explorer.core.database.get_config", return_value=config):
+            assert SettingsService().snapshot().model == ""
+
+
+class TestGetCache:
+    """Memoized single-key lookups."""
+
+    def test_get_memoized_until_set(self, svc):
+        assert svc.get("language") == "en"
+        with patch("arxiv_explorer.services.settings_service.get_connection") as conn:
+            assert svc.get("language") == "en"
+            conn.assert_not_called()
+        svc.set("language", "ko")
+        assert svc.get("language") == "ko"